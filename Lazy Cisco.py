@@ -1,8 +1,19 @@
 import os
+import copy
 import json
+import logging
+import mmap
 import keyring
 import datetime
+import functools
 import re
+import stat
+import threading
+import weakref
+from contextlib import contextmanager
+from collections import OrderedDict, defaultdict
+from itertools import chain, count, groupby
+import time
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -12,11 +23,361 @@ from PyQt5.QtWidgets import (
     QTreeWidget, QTreeWidgetItem, QProgressBar
 )
 from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtCore import Qt, QSize, QDir, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, QSize, QDir, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
 from netmiko import ConnectHandler
 from netmiko.exceptions import NetmikoAuthenticationException, NetmikoTimeoutException
 import keyring.errors
 
+# orjson is optional; it parses/serializes straight from/to bytes and is much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning (seconds), overridable through the environment
+CONNECTION_POOL_IDLE_TIMEOUT = int(os.environ.get("CONNECTION_POOL_IDLE_TIMEOUT", "300"))
+CONNECTION_POOL_SWEEP_INTERVAL = int(os.environ.get("CONNECTION_POOL_SWEEP_INTERVAL", "60"))
+CONNECTION_POOL_MAX_AGE = int(os.environ.get("CONNECTION_POOL_MAX_AGE", "3600"))
+# Maximum number of pooled sessions
+CONNECTION_POOL_MAX_SIZE = int(os.environ.get("CONNECTION_POOL_MAX_SIZE", "100"))
+
+# Upper bound for the shared worker thread pool
+WORKER_THREAD_LIMIT = min(8, os.cpu_count() or 1)
+
+# Number of switch logins that may run at once; they wait on the network, not the CPU
+CONNECT_THREAD_LIMIT = 16
+
+# Buffer size for config/template/backup writes, so each save is a single write() call
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum time to wait for a streamed command to return to the prompt (seconds)
+STREAM_COMMAND_TIMEOUT = 120
+
+# Number of template files kept in memory by TemplateManager.load_template
+TEMPLATE_CACHE_SIZE = 64
+
+# Delay used to coalesce bursts of list selection/click events into one update (milliseconds)
+SELECTION_DEBOUNCE_MS = 30
+
+# Delay before a drag-and-drop reorder of the switch list is written to disk (milliseconds)
+SWITCH_ORDER_SAVE_DELAY_MS = 500
+
+# Number of 'show running-config interface' results kept per switch tab
+INTERFACE_CONFIG_CACHE_SIZE = 128
+
+# How long a fetched 'show running-config' is reused (seconds)
+RUNNING_CONFIG_CACHE_TTL = 30
+
+# Running configurations fetched per session:
+# {id(connection): (fetched_at monotonic, config_text, fetched_at datetime)}
+_RUNCONFIG_CACHE = {}
+
+# Configuration generation per session, bumped by every invalidate_running_config call:
+# {id(connection): generation}
+_CONFIG_GENERATIONS = {}
+_CONFIG_GENERATION_COUNTER = count(1)
+
+# One lock per SSH session; pooled sessions are shared by tabs, dialogs and pool threads
+_CONNECTION_LOCKS = weakref.WeakKeyDictionary()
+_CONNECTION_LOCKS_GUARD = threading.Lock()
+
+
+def connection_lock(connection):
+    """
+    Returns the lock that serializes access to a Netmiko connection. Hold it around every
+    send_command/send_config_set/channel operation; an SSH channel is not thread-safe.
+    """
+    with _CONNECTION_LOCKS_GUARD:
+        lock = _CONNECTION_LOCKS.get(connection)
+        if lock is None:
+            lock = _CONNECTION_LOCKS[connection] = threading.RLock()
+        return lock
+
+
+def get_running_config(connection, force_refresh=False):
+    """
+    Returns the switch's running configuration, reusing a copy fetched less than
+    RUNNING_CONFIG_CACHE_TTL seconds ago on the same connection.
+    """
+    key = id(connection)
+    cached = _RUNCONFIG_CACHE.get(key)
+    if cached and not force_refresh and time.monotonic() - cached[0] < RUNNING_CONFIG_CACHE_TTL:
+        return cached[1]
+    with connection_lock(connection):
+        config_text = connection.send_command("show running-config")
+    _RUNCONFIG_CACHE[key] = (time.monotonic(), config_text, datetime.datetime.now())
+    return config_text
+
+
+def peek_running_config(connection):
+    """
+    Returns (config_text, fetched_at) of the last running configuration fetched on the
+    connection regardless of its age, or None if there is none. Never contacts the switch.
+    """
+    cached = _RUNCONFIG_CACHE.get(id(connection))
+    if cached is None:
+        return None
+    return cached[1], cached[2]
+
+
+def invalidate_running_config(connection):
+    """Drops the cached running configuration of a connection (call after any config change)."""
+    _RUNCONFIG_CACHE.pop(id(connection), None)
+    _CONFIG_GENERATIONS[id(connection)] = next(_CONFIG_GENERATION_COUNTER)
+
+
+def config_generation(connection):
+    """
+    Returns a number that changes whenever the connection's configuration is invalidated,
+    so callers can tell whether output they cached from the switch may be stale.
+    """
+    return _CONFIG_GENERATIONS.get(id(connection), 0)
+
+
+def stream_command_to_file(connection, command, f, timeout=STREAM_COMMAND_TIMEOUT):
+    """
+    Runs a show command and writes its output to the binary file f as it arrives,
+    instead of collecting the whole output in memory first.
+    The echoed command and the trailing prompt are stripped like send_command does.
+    """
+    prompt = connection.find_prompt()
+    connection.write_channel(connection.normalize_cmd(command))
+
+    # Data not yet written; the tail is held back until we know it is not the prompt
+    pending = ""
+    hold_back = len(prompt) + 2
+    echo_stripped = False
+    written = False
+    deadline = time.monotonic() + timeout
+
+    while True:
+        chunk = connection.read_channel()
+        if not chunk:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for '{command}' to complete")
+            time.sleep(0.05)
+            continue
+
+        pending = (pending + chunk).replace('\r\n', '\n')
+        if not echo_stripped:
+            newline = pending.find('\n')
+            if newline == -1:
+                continue
+            pending = pending[newline + 1:]
+            echo_stripped = True
+
+        # Only a prompt on a line of its own ends the output; a config line such as a
+        # description may also end with the prompt text
+        stripped = pending.rstrip()
+        if stripped.endswith('\n' + prompt) or (stripped == prompt and not written):
+            f.write(stripped[:-len(prompt)].encode('utf-8'))
+            return
+
+        if len(pending) > hold_back:
+            f.write(pending[:-hold_back].encode('utf-8'))
+            pending = pending[-hold_back:]
+            written = True
+
+
+def send_command_batch(connection, commands, timeout=STREAM_COMMAND_TIMEOUT):
+    """
+    Sends several show commands in one write and waits for all of their prompts at once,
+    instead of paying the prompt-detection round trip of send_command for each.
+    Returns the outputs in command order, with echoes and prompts stripped.
+    """
+    prompt = connection.find_prompt()
+    connection.write_channel("".join(connection.normalize_cmd(command) for command in commands))
+
+    prompt_re = re.compile(r'^' + re.escape(prompt), re.MULTILINE)
+    output = ""
+    deadline = time.monotonic() + timeout
+
+    while True:
+        chunk = connection.read_channel()
+        if not chunk:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for '{commands[-1]}' to complete")
+            time.sleep(0.05)
+            continue
+
+        output = (output + chunk).replace('\r\n', '\n')
+        if output.rstrip().endswith(prompt) and len(prompt_re.findall(output)) >= len(commands):
+            break
+
+    # Each block starts with the echoed command and ends where the next prompt begins
+    results = []
+    for command, block in zip(commands, prompt_re.split(output)):
+        echo, _, body = block.partition('\n')
+        if command not in echo:
+            raise ValueError(f"Unexpected echo for '{command}': {echo.strip()}")
+        results.append(body.rstrip())
+    return results
+
+
+# ConnectionPool Class
+class ConnectionPool:
+    """
+    Keeps Netmiko sessions warm so reopening a switch skips the SSH handshake and login.
+    Sessions are keyed by (ip, port, username); released sessions stay open until
+    they have been idle for longer than the idle timeout or older than the max age.
+    """
+    _instance = None
+
+    def __init__(self, idle_timeout=CONNECTION_POOL_IDLE_TIMEOUT, max_age=CONNECTION_POOL_MAX_AGE,
+                 max_size=CONNECTION_POOL_MAX_SIZE):
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        # {(ip, port, username): [connection, last_used, users, created]}
+        self._connections = {}
+
+    @classmethod
+    def instance(cls):
+        """Returns the shared connection pool."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _is_alive(self, connection):
+        """Returns True if the session can still be used."""
+        lock = connection_lock(connection)
+        if not lock.acquire(blocking=False):
+            # A command is running on it right now, so it is alive
+            return True
+        try:
+            return connection.is_alive()
+        except Exception:
+            return False
+        finally:
+            lock.release()
+
+    def _close(self, connection):
+        """
+        Closes a session, ignoring errors from an already dead channel.
+        Waits for a command still running on it (e.g. a queued backup) to finish first.
+        """
+        invalidate_running_config(connection)
+        try:
+            with connection_lock(connection):
+                connection.disconnect()
+        except Exception as e:
+            logger.error("Error closing pooled connection: %s", e)
+
+    def _is_expired(self, entry, now):
+        """Returns True if a released session has gone idle or outlived the max age."""
+        connection, last_used, users, created = entry
+        return users == 0 and (now - last_used >= self.idle_timeout or now - created >= self.max_age)
+
+    def _make_room(self):
+        """
+        Removes the least recently used released session once the pool is full.
+        Returns the removed sessions; the caller closes them after dropping the lock.
+        """
+        if len(self._connections) < self.max_size:
+            return []
+        idle = [(entry[1], key) for key, entry in self._connections.items() if entry[2] == 0]
+        if not idle:
+            return []
+        key = min(idle)[1]
+        logger.debug("Pool full, closing least recently used connection to %s", key[0])
+        return [self._connections.pop(key)[0]]
+
+    def acquire(self, ip, port, username, password, device_type='cisco_ios', timeout=10):
+        """
+        Returns a live session for the given switch, reusing a pooled one when possible.
+        Every acquire must be paired with a release.
+        """
+        key = (ip, port, username)
+        # The lock only guards the dictionary; logins and disconnects happen outside it so a
+        # slow switch never holds up release() on the GUI thread or logins to other switches
+        with self._lock:
+            entry = self._connections.get(key)
+            expired = entry is not None and self._is_expired(entry, time.monotonic())
+        # The liveness probe writes to the socket, so it also runs without the lock
+        alive = entry is not None and not expired and self._is_alive(entry[0])
+        with self._lock:
+            stale = []
+            current = self._connections.get(key)
+            # A different entry was just added by another thread's login, so it is fresh too
+            if current is not None and (current is not entry or alive):
+                current[1] = time.monotonic()
+                current[2] += 1
+                logger.debug("Reusing pooled connection to %s", ip)
+                return current[0]
+            if current is not None:
+                del self._connections[key]
+                stale.append(current[0])
+            stale.extend(self._make_room())
+        for connection in stale:
+            self._close(connection)
+
+        connection = ConnectHandler(
+            device_type=device_type,
+            host=ip,
+            port=port,
+            username=username,
+            password=password,
+            timeout=timeout
+        )
+        with self._lock:
+            now = time.monotonic()
+            entry = self._connections.get(key)
+            if entry is None:
+                self._connections[key] = [connection, now, 1, now]
+                return connection
+            # Another thread logged in to the same switch meanwhile; share its session
+            entry[1] = now
+            entry[2] += 1
+            shared = entry[0]
+        self._close(connection)
+        return shared
+
+    def release(self, connection):
+        """Returns a session to the pool; it stays open until it goes idle."""
+        with self._lock:
+            for entry in self._connections.values():
+                if entry[0] is connection:
+                    entry[1] = time.monotonic()
+                    entry[2] = max(0, entry[2] - 1)
+                    return
+
+    def evict_idle(self):
+        """Closes released sessions that have gone idle or outlived the max age."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._connections.items() if self._is_expired(entry, now)]
+            connections = [self._connections.pop(key)[0] for key in expired]
+        for key, connection in zip(expired, connections):
+            logger.debug("Closing idle pooled connection to %s", key[0])
+            self._close(connection)
+
+    def close_all(self):
+        """Closes every pooled session (used on application exit)."""
+        with self._lock:
+            connections = [entry[0] for entry in self._connections.values()]
+            self._connections.clear()
+        for connection in connections:
+            self._close(connection)
+
+
+# JSON helpers
+def _json_dumps(data):
+    """Serializes data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode('utf-8')
+
+
+def _json_loads(raw):
+    """Parses JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 # ConfigManager Class
 class ConfigManager:
@@ -24,40 +385,141 @@ class ConfigManager:
     Manages application configurations, including saving and loading switch credentials
     and application settings.
     """
+    _instance = None
+
     def __init__(self):
         self.app_name = "CiscoSwitchGUI"
         self.switches_file = "switches.json"
         self.settings_file = "settings.json"
+        # In-memory copies of the JSON files, keyed by file mtime.
+        # Switches are held as an OrderedDict {ip: {"ip": ..., "name": ...}} in file order.
+        self._switches_by_ip = None
+        self._switches_mtime = None
+        self._settings_cache = None
+        self._settings_mtime = None
+        # Keyring credentials already fetched in this session: {ip: (username, password)}
+        self._cred_cache = {}
+        # Nesting depth of batch(); while above zero, switches.json writes are held back
+        self._batch_depth = 0
+        self._switches_dirty = False
         self._ensure_config_dir()
         self.settings = self._load_settings()
 
+    @classmethod
+    def instance(cls):
+        """Returns the config manager shared by the main window and all tabs (and its caches)."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def _ensure_config_dir(self):
         """Ensures the configuration directory and necessary files exist."""
-        if not os.path.exists("config"):
-            os.makedirs("config")
+        os.makedirs("config", exist_ok=True)
         switches_path = os.path.join("config", self.switches_file)
-        if not os.path.exists(switches_path):
-            with open(switches_path, 'w') as f:
-                json.dump([], f)
+        try:
+            with open(switches_path, 'xb') as f:
+                f.write(_json_dumps([]))
+        except FileExistsError:
+            pass
         settings_path = os.path.join("config", self.settings_file)
-        if not os.path.exists(settings_path):
-            with open(settings_path, 'w') as f:
-                json.dump({"open_in_new_window": False}, f, indent=4)
+        try:
+            with open(settings_path, 'xb') as f:
+                f.write(_json_dumps({"open_in_new_window": False}))
+        except FileExistsError:
+            pass
+
+    def _atomic_write_json(self, path, data):
+        """
+        Serializes data to JSON and atomically replaces path with it (temp file + os.replace).
+        The write is skipped when the file already holds exactly this content.
+        Returns True if the file was written.
+        """
+        new_bytes = _json_dumps(data)
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == new_bytes:
+                    return False
+        except FileNotFoundError:
+            pass
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(new_bytes)
+        os.replace(tmp_path, path)
+        return True
+
+    def _get_mtime(self, path):
+        """Returns the modification time of a file in nanoseconds, or None if it is missing."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_switches_by_ip(self):
+        """
+        Returns the cached {ip: switch} OrderedDict, re-reading switches.json only when its
+        mtime changed. Converts the old IP list format to the dictionary format if necessary.
+        """
+        switches_path = os.path.join("config", self.switches_file)
+        mtime = self._get_mtime(switches_path)
+        if self._switches_by_ip is not None and mtime is not None and mtime == self._switches_mtime:
+            return self._switches_by_ip
+
+        try:
+            with open(switches_path, 'rb') as f:
+                switches_data = _json_loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            switches_data = []
+
+        # Convert old format to new format if necessary
+        if switches_data and isinstance(switches_data[0], str):
+            switches_data = [{"ip": ip_addr, "name": ""} for ip_addr in switches_data]
+            # Save in new format
+            self._atomic_write_json(switches_path, switches_data)
+            mtime = self._get_mtime(switches_path)
+
+        self._switches_by_ip = OrderedDict((switch["ip"], switch) for switch in switches_data)
+        self._switches_mtime = mtime
+        return self._switches_by_ip
+
+    def _save_switches(self):
+        """
+        Writes the cached switch dictionary back to switches.json as a list.
+        Inside batch() the write is postponed until the outermost batch ends.
+        """
+        if self._batch_depth:
+            self._switches_dirty = True
+            return
+        switches_path = os.path.join("config", self.switches_file)
+        try:
+            self._atomic_write_json(switches_path, list(self._switches_by_ip.values()))
+        except Exception:
+            # The in-memory copy no longer matches the file; re-read it next time
+            self._switches_by_ip = None
+            raise
+        self._switches_mtime = self._get_mtime(switches_path)
 
     def _load_settings(self):
-        """Loads application settings."""
+        """Loads application settings (served from memory while the file is unchanged)."""
         settings_path = os.path.join("config", self.settings_file)
+        mtime = self._get_mtime(settings_path)
+        if self._settings_cache is not None and mtime is not None and mtime == self._settings_mtime:
+            return copy.deepcopy(self._settings_cache)
         try:
-            with open(settings_path, 'r') as f:
-                return json.load(f)
+            with open(settings_path, 'rb') as f:
+                settings = _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             return {"open_in_new_window": False}
+        self._settings_cache = copy.deepcopy(settings)
+        self._settings_mtime = mtime
+        return settings
 
     def _save_settings(self):
         """Saves application settings."""
         settings_path = os.path.join("config", self.settings_file)
-        with open(settings_path, 'w') as f:
-            json.dump(self.settings, f, indent=4)
+        self._atomic_write_json(settings_path, self.settings)
+        self._settings_cache = copy.deepcopy(self.settings)
+        self._settings_mtime = self._get_mtime(settings_path)
 
     def get_setting(self, key, default_value=None):
         """Retrieves a specific setting."""
@@ -68,60 +530,114 @@ class ConfigManager:
         self.settings[key] = value
         self._save_settings()
 
-    def save_switch_credentials(self, ip, username, password, name=""):
+    @contextmanager
+    def batch(self):
+        """
+        Groups several switch changes so switches.json is written once, when the batch ends.
+        If that write fails, the error is raised from the with statement (unless the body
+        itself already raised).
+        """
+        self._batch_depth += 1
+        body_failed = True
+        try:
+            yield self
+            body_failed = False
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._switches_dirty:
+                self._switches_dirty = False
+                try:
+                    self._save_switches()
+                except Exception as e:
+                    logger.error("Error saving switches: %s", e)
+                    if not body_failed:
+                        raise
+
+    def save_switches(self, switches):
+        """
+        Saves several switches at once; each item is a dict with ip, username, password
+        and optionally name. Returns True if every switch was saved.
+        """
+        try:
+            with self.batch():
+                results = [self.save_switch_credentials(switch["ip"], switch["username"], switch["password"],
+                                                        switch.get("name"))
+                           for switch in switches]
+        except Exception:
+            return False
+        return all(results)
+
+    def save_switch_credentials(self, ip, username, password, name=None):
         """
         Saves switch credentials (username and password to keyring, IP and name to JSON file).
+        If name is None, an existing switch keeps its current name.
         """
         try:
             # Save credentials to keyring
             keyring.set_password(self.app_name, f"{ip}_username", username)
             keyring.set_password(self.app_name, f"{ip}_password", password)
+            self._cred_cache[ip] = (username, password)
 
-            # Load existing switches from JSON file
-            switches_path = os.path.join("config", self.switches_file)
-            try:
-                with open(switches_path, 'r') as f:
-                    switches_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                switches_data = []
-
-            # Convert old format to new format if necessary
-            if switches_data and isinstance(switches_data[0], str):
-                switches_data = [{"ip": ip_addr, "name": ""} for ip_addr in switches_data]
-
-            # Check if IP already exists and update it
-            ip_exists = False
-            for switch in switches_data:
-                if switch["ip"] == ip:
-                    switch["name"] = name
-                    ip_exists = True
-                    break
-
-            # If IP doesn't exist, add it
-            if not ip_exists:
-                switches_data.append({"ip": ip, "name": name})
+            # Update the switch in place, or append it if the IP is new
+            switches = self._load_switches_by_ip()
+            if name is None:
+                existing = switches.get(ip)
+                name = existing.get("name", "") if existing else ""
+            switches[ip] = {"ip": ip, "name": name}
 
             # Save updated switches data
-            with open(switches_path, 'w') as f:
-                json.dump(switches_data, f, indent=4)
+            self._save_switches()
 
-            print(f"DEBUG: Switch credentials saved for {ip}")
+            logger.debug("Switch credentials saved for %s", ip)
             return True
 
         except Exception as e:
-            print(f"DEBUG: Error saving switch credentials: {str(e)}")
+            logger.error("Error saving switch credentials: %s", e)
             return False
 
     def get_switch_credentials(self, ip):
-        """Retrieves switch credentials from keyring."""
+        """Retrieves switch credentials, hitting the keyring only on a cache miss."""
+        cached = self._cred_cache.get(ip)
+        if cached is not None:
+            return cached
         try:
             username = keyring.get_password(self.app_name, f"{ip}_username")
             password = keyring.get_password(self.app_name, f"{ip}_password")
+            # Misses are not cached, so a keyring unlocked later is still picked up
+            if username is not None and password is not None:
+                self._cred_cache[ip] = (username, password)
             return username, password
         except Exception as e:
-            print(f"DEBUG: Error retrieving credentials for {ip}: {str(e)}")
+            logger.error("Error retrieving credentials for %s: %s", ip, e)
             return None, None
 
+    def read_credentials(self, ips):
+        """
+        Reads the credentials of the given switches from the keyring without touching any
+        cached state, so it can run on a pool thread.
+        Returns {ip: (username, password)} for the switches whose credentials were found.
+        """
+        credentials = {}
+        for ip in ips:
+            try:
+                username = keyring.get_password(self.app_name, f"{ip}_username")
+                password = keyring.get_password(self.app_name, f"{ip}_password")
+                if username is not None and password is not None:
+                    credentials[ip] = (username, password)
+            except Exception as e:
+                logger.error("Error prefetching credentials for %s: %s", ip, e)
+        return credentials
+
+    def cache_credentials(self, credentials):
+        """
+        Adds credentials returned by read_credentials to the cache (on the GUI thread).
+        Switches deleted since then are skipped, and credentials saved since then are kept.
+        """
+        switches = self._load_switches_by_ip()
+        for ip, pair in credentials.items():
+            if ip in switches:
+                self._cred_cache.setdefault(ip, pair)
+
     def get_saved_switches(self):
         """
         Retrieves saved switch IPs (for backward compatibility with old format).
@@ -133,27 +649,19 @@ class ConfigManager:
         """
         Retrieves full information (IP, name) of saved switches.
         Converts old IP list format to new dictionary format if necessary.
+        The parsed data is cached and only re-read when the file's mtime changes.
         """
-        switches_path = os.path.join("config", self.switches_file)
-        try:
-            with open(switches_path, 'r') as f:
-                switches_data = json.load(f)
-                
-            # Convert old format to new format if necessary
-            if switches_data and isinstance(switches_data[0], str):
-                switches_data = [{"ip": ip_addr, "name": ""} for ip_addr in switches_data]
-                # Save in new format
-                with open(switches_path, 'w') as f:
-                    json.dump(switches_data, f, indent=4)
-                    
-            return switches_data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return copy.deepcopy(list(self._load_switches_by_ip().values()))
+
+    def get_saved_switch_names(self):
+        """Returns (ip, name) pairs of the saved switches in list order, without copying the records."""
+        return [(ip, switch.get("name", "")) for ip, switch in self._load_switches_by_ip().items()]
 
     def delete_switch(self, ip):
         """Deletes a switch with the given IP address."""
         try:
             # Remove from keyring
+            self._cred_cache.pop(ip, None)
             try:
                 keyring.delete_password(self.app_name, f"{ip}_username")
                 keyring.delete_password(self.app_name, f"{ip}_password")
@@ -161,90 +669,92 @@ class ConfigManager:
                 pass  # Password was not found, which is okay
 
             # Remove from JSON file
-            switches_path = os.path.join("config", self.switches_file)
-            switches_data = self.get_saved_switches_full()
-            switches_data = [switch for switch in switches_data if switch["ip"] != ip]
+            self._load_switches_by_ip().pop(ip, None)
+            self._save_switches()
 
-            with open(switches_path, 'w') as f:
-                json.dump(switches_data, f, indent=4)
-
-            print(f"DEBUG: Switch {ip} deleted successfully")
+            logger.debug("Switch %s deleted successfully", ip)
             return True
 
         except Exception as e:
-            print(f"DEBUG: Error deleting switch {ip}: {str(e)}")
+            logger.error("Error deleting switch %s: %s", ip, e)
             return False
 
     def update_switch_name(self, ip, new_name):
         """Updates the name of a switch with the given IP address."""
         try:
-            switches_path = os.path.join("config", self.switches_file)
-            switches_data = self.get_saved_switches_full()
-            
-            for switch in switches_data:
-                if switch["ip"] == ip:
-                    switch["name"] = new_name
-                    break
+            switch = self._load_switches_by_ip().get(ip)
+            if switch is not None:
+                switch["name"] = new_name
 
-            with open(switches_path, 'w') as f:
-                json.dump(switches_data, f, indent=4)
+            self._save_switches()
 
-            print(f"DEBUG: Switch name updated for {ip}: {new_name}")
+            logger.debug("Switch name updated for %s: %s", ip, new_name)
             return True
 
         except Exception as e:
-            print(f"DEBUG: Error updating switch name for {ip}: {str(e)}")
+            logger.error("Error updating switch name for %s: %s", ip, e)
             return False
 
     def backup_config(self, connection, ip):
-        """Backs up the switch configuration."""
+        """Backs up the switch configuration, streaming it straight to the backup file."""
         try:
-            config = connection.send_command("show running-config")
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"backup_{ip}_{timestamp}.txt"
             
-            if not os.path.exists("backups"):
-                os.makedirs("backups")
+            os.makedirs("backups", exist_ok=True)
+            path = os.path.join("backups", filename)
             
-            with open(os.path.join("backups", filename), 'w') as f:
-                f.write(config)
+            # Stream into a temporary file so a failed backup never leaves a partial one behind
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    with connection_lock(connection):
+                        stream_command_to_file(connection, "show running-config", f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
             
             return filename
         except Exception as e:
-            print(f"DEBUG: Error backing up config: {str(e)}")
+            logger.error("Error backing up config: %s", e)
             return None
 
     def restore_config(self, connection, filename):
         """Restores the switch configuration from a backup file."""
         try:
-            with open(os.path.join("backups", filename), 'r') as f:
-                config = f.read()
+            # Memory-map the backup and split it line by line rather than reading it into one string
+            with open(os.path.join("backups", filename), 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    config_lines = []
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        config_lines = [line.decode('utf-8').rstrip('\r\n') for line in iter(mm.readline, b'')]
             
-            config_lines = config.split('\n')
-            connection.send_config_set(config_lines)
+            with connection_lock(connection):
+                connection.send_config_set(config_lines)
+            invalidate_running_config(connection)
             return True
         except Exception as e:
-            print(f"DEBUG: Error restoring config: {str(e)}")
+            logger.error("Error restoring config: %s", e)
             return False
 
     def save_switches_order(self, ordered_ips):
         """Saves the new order of switches to the JSON file."""
-        # Get current switches data
-        switches_data = self.get_saved_switches_full()
-        
-        # Create a dictionary for quick lookup
-        switches_dict = {switch["ip"]: switch for switch in switches_data}
+        switches = self._load_switches_by_ip()
         
-        # Create new ordered list based on the provided IP order
-        new_ordered_switches = []
-        for ip in ordered_ips:
-            if ip in switches_dict:
-                new_ordered_switches.append(switches_dict[ip])
+        # Rebuild the dictionary in the provided IP order (unknown IPs are ignored, and switches
+        # saved after the order was taken are kept at the end)
+        self._switches_by_ip = OrderedDict((ip, switches[ip]) for ip in ordered_ips if ip in switches)
+        for ip, switch in switches.items():
+            self._switches_by_ip.setdefault(ip, switch)
         
         # Save the new ordered list
-        with open(os.path.join("config", self.switches_file), 'w') as f:
-            json.dump(new_ordered_switches, f, indent=4)
-        print(f"DEBUG: Switch order saved: {ordered_ips}")
+        self._save_switches()
+        logger.debug("Switch order saved: %s", ordered_ips)
 
 
 # InterfaceSearcher Class
@@ -252,118 +762,347 @@ class InterfaceSearcher:
     """
     Handles interface searching and filtering based on configuration content.
     """
+    # Matches an 'interface ...' line plus its indented (or blank) sub-commands,
+    # stopping at the next top-level command.
+    _IFACE_RE = re.compile(r'^interface ([^\n]*)(?:\n(?:[ \t][^\n]*|(?=\n|\Z)))*', re.MULTILINE)
+
+    # Index of the last searched configuration: (config_text, text_lower, {name: (start, end)}).
+    # Shared by all instances so consecutive searches on the same config skip the parse.
+    _index_cache = None
+
     def __init__(self):
         pass
 
-    def parse_interfaces_from_config(self, config_text):
+    def _get_index(self, config_text):
         """
-        Parses the running configuration to extract interface blocks.
-        Returns a dictionary where keys are interface names and values are their configurations.
+        Returns (text_lower, blocks) for config_text, where blocks maps each interface name to
+        the (start, end) offsets of its block. text_lower is None when lower-casing changed the
+        text length (block offsets would not line up with it).
         """
-        interfaces = {}
-        current_interface = None
-        current_config = []
-        
-        lines = config_text.split('\n')
-        
-        for line in lines:
-            # Check if line starts an interface block
-            if line.startswith('interface '):
-                # Save previous interface if exists
-                if current_interface:
-                    interfaces[current_interface] = '\n'.join(current_config)
-                
-                # Start new interface
-                current_interface = line.replace('interface ', '')
-                current_config = [line]
-            
-            # Check if we're exiting interface configuration (next top-level command)
-            elif current_interface and line and not line.startswith(' ') and not line.startswith('\t') and line.strip():
-                # We've hit a new top-level command, save current interface
-                interfaces[current_interface] = '\n'.join(current_config)
-                current_interface = None
-                current_config = []
-            
-            # If we're inside an interface block, add the line
-            elif current_interface:
-                current_config.append(line)
-        
-        # Save the last interface if exists
-        if current_interface:
-            interfaces[current_interface] = '\n'.join(current_config)
-        
-        return interfaces
+        cached = InterfaceSearcher._index_cache
+        if cached is not None and cached[0] == config_text:
+            return cached[1], cached[2]
+
+        text_lower = config_text.lower()
+        if len(text_lower) != len(config_text):
+            text_lower = None
+
+        # Later blocks with the same name replace earlier ones
+        blocks = {m.group(1): m.span() for m in self._IFACE_RE.finditer(config_text)}
+        InterfaceSearcher._index_cache = (config_text, text_lower, blocks)
+        return text_lower, blocks
+
+    def search_interfaces(self, config_text, search_term, search_mode):
+        """
+        Searches interface blocks in a single pass over the configuration.
+        search_mode is 'include' (block contains the term) or 'exclude' (block does not).
+        Returns a list of matching interface names.
+        """
+        search_term_lower = search_term.lower().strip()
+        exclude = (search_mode == 'exclude')
+
+        # The config is lower-cased and split into block offsets once, then reused by
+        # consecutive searches; each block is checked with a C-level str.find.
+        text_lower, blocks = self._get_index(config_text)
+        if text_lower is not None:
+            find = text_lower.find
+            matching_interfaces = [name for name, (start, end) in blocks.items()
+                                   if (find(search_term_lower, start, end) != -1) != exclude]
+        else:
+            # Rare non-ASCII case: match case-insensitively on the original text instead
+            # of lower-casing every block
+            term_search = re.compile(re.escape(search_term_lower), re.IGNORECASE).search
+            matching_interfaces = [name for name, (start, end) in blocks.items()
+                                   if (term_search(config_text, start, end) is not None) != exclude]
+
+        logger.debug("Found %d of %d interfaces for %s '%s'", len(matching_interfaces), len(blocks), search_mode.upper(), search_term_lower)
+        return matching_interfaces
 
     def search_interfaces_include(self, config_text, search_term):
         """
         Searches for interfaces that include the specified configuration.
         Returns a list of interface names that contain the search term in their configuration.
         """
-        interfaces_dict = self.parse_interfaces_from_config(config_text)
-        matching_interfaces = []
-        
-        search_term_lower = search_term.lower().strip()
-        print(f"DEBUG: Searching for INCLUDE '{search_term_lower}' in {len(interfaces_dict)} interfaces")
-        
-        for interface_name, interface_config in interfaces_dict.items():
-            if search_term_lower in interface_config.lower():
-                matching_interfaces.append(interface_name)
-                print(f"DEBUG: MATCH found in {interface_name}")
-        
-        print(f"DEBUG: Found {len(matching_interfaces)} matching interfaces for INCLUDE search")
-        return matching_interfaces
+        return self.search_interfaces(config_text, search_term, 'include')
 
     def search_interfaces_exclude(self, config_text, search_term):
         """
         Searches for interfaces that do NOT include the specified configuration.
         Returns a list of interface names that do not contain the search term in their configuration.
         """
-        interfaces_dict = self.parse_interfaces_from_config(config_text)
-        matching_interfaces = []
-        
-        search_term_lower = search_term.lower().strip()
-        print(f"DEBUG: Searching for EXCLUDE '{search_term_lower}' in {len(interfaces_dict)} interfaces")
-        
-        for interface_name, interface_config in interfaces_dict.items():
-            if search_term_lower not in interface_config.lower():
-                matching_interfaces.append(interface_name)
-                print(f"DEBUG: EXCLUDE match found in {interface_name}")
-        
-        print(f"DEBUG: Found {len(matching_interfaces)} matching interfaces for EXCLUDE search")
-        return matching_interfaces
+        return self.search_interfaces(config_text, search_term, 'exclude')
 
 
-# SearchWorkerThread Class
-class SearchWorkerThread(QThread):
+# WorkerSignals Class
+class WorkerSignals(QObject):
     """
-    Worker thread for performing interface search operations.
+    Signals for QRunnable workers (QRunnable is not a QObject and cannot define signals itself).
     """
-    search_completed = pyqtSignal(list)
-    search_error = pyqtSignal(str)
-    
-    def __init__(self, connection, search_term, search_mode):
+    completed = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+# SearchRunnable Class
+class SearchRunnable(QRunnable):
+    """
+    Worker for performing interface search operations on the shared thread pool.
+    """
+    def __init__(self, connection, search_term, search_mode, force_refresh=False, cached_config=None):
         super().__init__()
+        self.signals = WorkerSignals()
         self.connection = connection
         self.search_term = search_term
         self.search_mode = search_mode
+        self.force_refresh = force_refresh
+        # Configuration text supplied by the caller; when set, the switch is not queried
+        self.cached_config = cached_config
         self.interface_searcher = InterfaceSearcher()
     
     def run(self):
-        """Execute the search operation in a separate thread."""
+        """Execute the search operation in a pool thread."""
         try:
-            # Get running configuration
-            config_text = self.connection.send_command("show running-config")
+            if self.cached_config is not None:
+                config_text = self.cached_config
+            else:
+                # Get running configuration (reused across consecutive searches)
+                config_text = get_running_config(self.connection, self.force_refresh)
             
             # Perform search based on mode
-            if self.search_mode == 'include':
-                interfaces = self.interface_searcher.search_interfaces_include(config_text, self.search_term)
-            else:  # exclude
-                interfaces = self.interface_searcher.search_interfaces_exclude(config_text, self.search_term)
+            interfaces = self.interface_searcher.search_interfaces(config_text, self.search_term, self.search_mode)
             
-            self.search_completed.emit(interfaces)
+            self.signals.completed.emit(interfaces)
             
         except Exception as e:
-            self.search_error.emit(str(e))
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+# NetmikoWorker Class
+class NetmikoWorker(QRunnable):
+    """
+    Worker that runs a single send_command on a thread pool.
+    Emits completed with the command output, or error with the error message.
+    """
+    def __init__(self, connection, command):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.connection = connection
+        self.command = command
+
+    def run(self):
+        """Send the command in a pool thread."""
+        try:
+            with connection_lock(self.connection):
+                output = self.connection.send_command(self.command)
+            self.signals.completed.emit(output)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+# NetmikoBatchWorker Class
+class NetmikoBatchWorker(QRunnable):
+    """
+    Worker that runs several show commands in a single submission on a thread pool.
+    Emits completed with the list of outputs, or error with the error message.
+    """
+    def __init__(self, connection, commands):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.connection = connection
+        self.commands = commands
+
+    def run(self):
+        """Send the commands in a pool thread."""
+        try:
+            with connection_lock(self.connection):
+                try:
+                    outputs = send_command_batch(self.connection, self.commands)
+                except Exception:
+                    # Discard output left on the channel (e.g. after a timeout), so the
+                    # commands reissued by the error handler do not read it as theirs
+                    try:
+                        self.connection.clear_buffer()
+                    except Exception as e:
+                        logger.debug("Could not clear channel buffer: %s", e)
+                    raise
+            self.signals.completed.emit(outputs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+# BackupRunnable Class
+class BackupRunnable(QRunnable):
+    """
+    Worker that backs up a switch configuration on the shared thread pool.
+    Emits completed with the backup filename, or None on failure.
+    """
+    def __init__(self, config_manager, connection, ip):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.config_manager = config_manager
+        self.connection = connection
+        self.ip = ip
+
+    def run(self):
+        """Run the backup in a pool thread."""
+        filename = self.config_manager.backup_config(self.connection, self.ip)
+        self.signals.completed.emit(filename)
+        self.signals.finished.emit()
+
+
+# CredentialPrefetchRunnable Class
+class CredentialPrefetchRunnable(QRunnable):
+    """
+    Worker that reads the credentials of the saved switches at startup,
+    overlapping the keyring round-trips with UI construction.
+    Emits completed with {ip: (username, password)}; the GUI thread adds them to the cache.
+    """
+    def __init__(self, config_manager, ips):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.config_manager = config_manager
+        self.ips = ips
+
+    def run(self):
+        """Read the credentials in a pool thread."""
+        credentials = self.config_manager.read_credentials(self.ips)
+        self.signals.completed.emit(credentials)
+        self.signals.finished.emit()
+
+
+# TemplatePreloadRunnable Class
+class TemplatePreloadRunnable(QRunnable):
+    """
+    Worker that reads the template tree and files into the TemplateManager caches
+    at startup, so the disk I/O stays off the GUI thread.
+    """
+    def __init__(self, template_manager):
+        super().__init__()
+        self.template_manager = template_manager
+
+    def run(self):
+        """Preload the template caches."""
+        try:
+            self.template_manager.preload()
+        except Exception as e:
+            logger.warning("Template preload failed: %s", e)
+
+
+# PoolSweepRunnable Class
+class PoolSweepRunnable(QRunnable):
+    """
+    Worker that closes idle pooled connections, so the SSH teardown of each
+    expired session happens off the GUI thread.
+    """
+    def run(self):
+        """Sweep the connection pool in a pool thread."""
+        ConnectionPool.instance().evict_idle()
+
+
+# ConnectRunnable Class
+class ConnectRunnable(QRunnable):
+    """
+    Worker that acquires a pooled switch session, so the SSH handshake and login
+    never block the GUI thread and several tabs can log in at the same time.
+    Emits completed with the connection, or error with the error message
+    (the exception itself is kept in self.exception).
+    """
+    _thread_pool = None
+
+    def __init__(self, ip, port, username, password, device_type='cisco_ios', timeout=10):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.ip = ip
+        self.port = port
+        self.username = username
+        self.password = password
+        self.device_type = device_type
+        self.timeout = timeout
+        self.connection = None
+        self.exception = None
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def thread_pool(cls):
+        """Returns the thread pool that connect workers run on."""
+        if cls._thread_pool is None:
+            cls._thread_pool = QThreadPool()
+            cls._thread_pool.setMaxThreadCount(CONNECT_THREAD_LIMIT)
+        return cls._thread_pool
+
+    def run(self):
+        """Acquire the session in a pool thread."""
+        try:
+            connection = ConnectionPool.instance().acquire(
+                self.ip, self.port, self.username, self.password, self.device_type, self.timeout
+            )
+        except Exception as e:
+            self.exception = e
+            self.signals.error.emit(str(e))
+        else:
+            with self._lock:
+                if self.cancelled:
+                    ConnectionPool.instance().release(connection)
+                else:
+                    self.connection = connection
+                    self.signals.completed.emit(connection)
+        finally:
+            self.signals.finished.emit()
+
+    def cancel(self):
+        """
+        Stops the session from being handed over. Returns the connection if it was
+        already handed over, in which case the caller must release it.
+        """
+        with self._lock:
+            self.cancelled = True
+            return self.connection
+
+
+# TemplateLoadRunnable Class
+class TemplateLoadRunnable(QRunnable):
+    """
+    Worker that reads a template file on the shared thread pool.
+    Emits completed with (relative_path, content); content is None on failure.
+    """
+    def __init__(self, template_manager, relative_path):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.template_manager = template_manager
+        self.relative_path = relative_path
+
+    def run(self):
+        """Load the template in a pool thread."""
+        content = self.template_manager.load_template(self.relative_path)
+        self.signals.completed.emit((self.relative_path, content))
+        self.signals.finished.emit()
+
+
+# TemplateSaveRunnable Class
+class TemplateSaveRunnable(QRunnable):
+    """
+    Worker that writes a template file on the shared thread pool.
+    Emits completed with True if the template was saved.
+    """
+    def __init__(self, template_manager, relative_path, content):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.template_manager = template_manager
+        self.relative_path = relative_path
+        self.content = content
+
+    def run(self):
+        """Save the template in a pool thread."""
+        saved = self.template_manager.save_template(self.relative_path, self.content)
+        self.signals.completed.emit(saved)
+        self.signals.finished.emit()
 
 
 # SearchDialog Class
@@ -374,14 +1113,20 @@ class SearchDialog(QDialog):
     """
     interfaces_selected = pyqtSignal(list)
     
-    def __init__(self, parent, connection, search_mode):
+    def __init__(self, parent, connection, search_mode, cached_config=None, cached_at=None):
         super().__init__(parent)
         self.connection = connection
         self.search_mode = search_mode
+        # Running configuration already held by the caller (searched until Refresh is used)
+        self.cached_config = cached_config
         self.search_worker = None
         self.search_results = []
+        # Rows of results_list that hold selectable interfaces (not the placeholder)
+        self._valid_rows = set()
         
         self.setWindowTitle(f"Interface Search - {search_mode.title()}")
+        if cached_config is not None and cached_at is not None:
+            self.setWindowTitle(f"Interface Search - {search_mode.title()} (config as of {cached_at:%H:%M})")
         self.setModal(True)
         self.resize(500, 400)
         
@@ -411,6 +1156,11 @@ class SearchDialog(QDialog):
         self.search_button = QPushButton("Search")
         self.search_button.clicked.connect(self.perform_search)
         search_button_layout.addWidget(self.search_button)
+        
+        self.refresh_button = QPushButton("Yenile")
+        self.refresh_button.setToolTip("Running-config bilgisini switch'ten yeniden alıp arama yapın")
+        self.refresh_button.clicked.connect(self.refresh_and_search)
+        search_button_layout.addWidget(self.refresh_button)
         search_button_layout.addStretch()
         
         search_layout.addLayout(search_button_layout)
@@ -459,7 +1209,11 @@ class SearchDialog(QDialog):
         
         self.setLayout(layout)
     
-    def perform_search(self):
+    def refresh_and_search(self):
+        """Re-fetch the running configuration and run the search again."""
+        self.perform_search(force_refresh=True)
+
+    def perform_search(self, force_refresh=False):
         """Initiate the interface search operation."""
         search_term = self.search_input.toPlainText().strip()
         if not search_term:
@@ -468,27 +1222,36 @@ class SearchDialog(QDialog):
         
         # Disable UI during search
         self.search_button.setEnabled(False)
+        self.refresh_button.setEnabled(False)
         self.configure_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.results_list.clear()
         
-        # Start search worker thread
-        self.search_worker = SearchWorkerThread(self.connection, search_term, self.search_mode)
-        self.search_worker.search_completed.connect(self.on_search_completed)
-        self.search_worker.search_error.connect(self.on_search_error)
-        self.search_worker.finished.connect(self.on_search_finished)
-        self.search_worker.start()
+        if force_refresh and self.cached_config is not None:
+            # Stop using the caller's copy once the user asks for a fresh one
+            self.cached_config = None
+            self.setWindowTitle(f"Interface Search - {self.search_mode.title()}")
+        
+        # Run the search on the shared thread pool
+        self.search_worker = SearchRunnable(self.connection, search_term, self.search_mode, force_refresh, self.cached_config)
+        self.search_worker.signals.completed.connect(self.on_search_completed)
+        self.search_worker.signals.error.connect(self.on_search_error)
+        self.search_worker.signals.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(self.search_worker)
     
     def on_search_completed(self, interfaces):
         """Handle successful search completion."""
         self.search_results = interfaces
         self.results_list.clear()
+        self._valid_rows = set(range(len(interfaces)))
         
         if interfaces:
-            for interface in interfaces:
-                item = QListWidgetItem(interface)
-                self.results_list.addItem(item)
+            # Insert all rows in one call with repaints and signals suspended
+            self.results_list.setUpdatesEnabled(False)
+            with QSignalBlocker(self.results_list):
+                self.results_list.addItems(interfaces)
+            self.results_list.setUpdatesEnabled(True)
         else:
             item = QListWidgetItem("No interfaces found matching the criteria")
             item.setFlags(item.flags() & ~Qt.ItemIsSelectable & ~Qt.ItemIsEnabled)
@@ -500,30 +1263,33 @@ class SearchDialog(QDialog):
         """Handle search error."""
         QMessageBox.critical(self, "Search Error", f"Failed to perform search:\n{error_message}")
         self.results_list.clear()
+        self._valid_rows = set()
     
     def on_search_finished(self):
-        """Handle search thread completion."""
+        """Handle search worker completion."""
         self.search_button.setEnabled(True)
+        self.refresh_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.search_worker = None
     
     def select_all_interfaces(self):
         """Select all interfaces in the results list."""
-        for i in range(self.results_list.count()):
-            item = self.results_list.item(i)
-            if item.flags() & Qt.ItemIsSelectable:
-                item.setSelected(True)
+        # Block per-item selection signals and update the button once at the end
+        with QSignalBlocker(self.results_list):
+            for row in self._valid_rows:
+                self.results_list.item(row).setSelected(True)
         self.update_configure_button()
     
     def select_no_interfaces(self):
         """Deselect all interfaces in the results list."""
-        self.results_list.clearSelection()
+        with QSignalBlocker(self.results_list):
+            self.results_list.clearSelection()
         self.update_configure_button()
     
     def update_configure_button(self):
         """Update the state of the configure button based on selection."""
-        selected_items = self.results_list.selectedItems()
-        has_valid_selection = any(item.flags() & Qt.ItemIsSelectable for item in selected_items)
+        # Only interface rows are selectable, so any selection is a valid one
+        has_valid_selection = bool(self._valid_rows) and self.results_list.selectionModel().hasSelection()
         self.configure_button.setEnabled(has_valid_selection)
     
     def configure_selected_interfaces(self):
@@ -546,19 +1312,62 @@ class TemplateManager:
     Manages configuration templates stored as text files.
     Supports nested directories for templates.
     """
+    _instance = None
+
     def __init__(self):
         self.template_dir = "conf_templates"
+        # Recently loaded templates: {full_path: ((mtime_ns, size), content)}, least recently used first.
+        # Templates are also loaded/saved from pool threads, so the cache is guarded by a lock.
+        self._content_cache = OrderedDict()
+        self._content_lock = threading.Lock()
+        # Cached list_templates() result as one (tree, scanned directories, their mtimes) tuple,
+        # replaced in a single assignment because preload() fills it from a pool thread
+        self._tree_cache = None
+        # Cached list_top_level() results: {current_path: (directory mtime_ns, listing)}
+        self._level_cache = {}
         self._ensure_template_dir()
 
+    @classmethod
+    def instance(cls):
+        """Returns the template manager shared by all dialogs (and its caches)."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def _ensure_template_dir(self):
         """Ensures the root template directory exists."""
-        if not os.path.exists(self.template_dir):
-            os.makedirs(self.template_dir)
+        os.makedirs(self.template_dir, exist_ok=True)
 
     def _get_full_path(self, relative_path):
         """Converts a relative path to a full absolute path within the template directory."""
         return os.path.join(self.template_dir, relative_path)
 
+    def _invalidate_tree_cache(self):
+        """Forces the next list_templates() / list_top_level() call to rescan the template directory."""
+        self._tree_cache = None
+        self._level_cache = {}
+
+    def preload(self):
+        """
+        Reads the template tree and (up to TEMPLATE_CACHE_SIZE) template files into memory,
+        so later list_templates() / load_template() calls do not touch the disk.
+        """
+        pending = list(self.list_templates())
+        loaded = 0
+        while pending and loaded < TEMPLATE_CACHE_SIZE:
+            item = pending.pop(0)
+            if item['type'] == 'directory':
+                pending.extend(item['children'])
+            elif self.load_template(item['path']) is not None:
+                loaded += 1
+
+    def _get_tree_signature(self, dirs):
+        """Returns the mtimes of the given directories, or None if one of them is gone."""
+        try:
+            return tuple(os.stat(d).st_mtime_ns for d in dirs)
+        except OSError:
+            return None
+
     def save_template(self, relative_path, content):
         """
         Saves configuration content to a template file.
@@ -568,59 +1377,126 @@ class TemplateManager:
             full_path = self._get_full_path(relative_path)
             # Ensure parent directories exist
             parent_dir = os.path.dirname(full_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
             
-            with open(full_path, 'w') as f:
-                f.write(content)
+            with open(full_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content.encode('utf-8'))
+            with self._content_lock:
+                self._content_cache.pop(full_path, None)
+            self._invalidate_tree_cache()
             return True
         except Exception as e:
-            print(f"Error saving template: {str(e)}")
+            logger.error("Error saving template: %s", e)
             return False
 
     def load_template(self, relative_path):
-        """Loads configuration content from a template file."""
+        """
+        Loads configuration content from a template file.
+        Contents are served from memory while the file's mtime and size are unchanged.
+        """
         try:
             full_path = self._get_full_path(relative_path)
-            with open(full_path, 'r') as f:
-                return f.read()
+            st = os.stat(full_path)
+            key = (st.st_mtime_ns, st.st_size)
+            with self._content_lock:
+                cached = self._content_cache.get(full_path)
+                if cached is not None and cached[0] == key:
+                    self._content_cache.move_to_end(full_path)
+                    return cached[1]
+
+            # One unbuffered read of the whole file, decoded once
+            with open(full_path, 'rb', buffering=0) as f:
+                content = f.read().decode('utf-8')
+            if '\r' in content:
+                # Same newline handling as text mode (universal newlines)
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            with self._content_lock:
+                self._content_cache[full_path] = (key, content)
+                self._content_cache.move_to_end(full_path)
+                if len(self._content_cache) > TEMPLATE_CACHE_SIZE:
+                    self._content_cache.popitem(last=False)
+            return content
         except Exception as e:
-            print(f"Error loading template: {str(e)}")
+            logger.error("Error loading template: %s", e)
             return None
 
     def list_templates(self, current_path=""):
         """
         Lists all available templates and subdirectories in a tree-like structure.
         Returns a list of dictionaries, each representing a file or folder.
+        The full tree is cached until one of its directories changes; callers must not modify it.
+        """
+        if current_path:
+            return self._scan_templates(current_path, [])
+
+        cached = self._tree_cache
+        if cached is not None and self._get_tree_signature(cached[1]) == cached[2]:
+            return cached[0]
+
+        dirs = [self.template_dir]
+        tree = self._scan_templates("", dirs)
+        self._tree_cache = (tree, dirs, self._get_tree_signature(dirs))
+        return tree
+
+    def list_top_level(self, current_path=""):
+        """
+        Lists only the immediate templates and subdirectories of current_path (non-recursive).
+        Directory entries have no 'children' key. Listings are cached until the directory's
+        mtime changes; callers must not modify them.
+        """
+        search_path = self._get_full_path(current_path) if current_path else self.template_dir
+        try:
+            mtime = os.stat(search_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._level_cache.get(current_path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+
+        listing = self._scan_templates(current_path, [], recursive=False)
+        if mtime is not None:
+            self._level_cache[current_path] = (mtime, listing)
+        return listing
+
+    def _scan_templates(self, current_path, dirs, recursive=True):
+        """
+        Builds the template tree below current_path with os.scandir, appending the
+        full path of every subdirectory visited to dirs. With recursive=False only
+        the immediate entries of current_path are listed.
         """
         template_list = []
         search_path = self._get_full_path(current_path) if current_path else self.template_dir
         
         try:
-            if not os.path.exists(search_path):
-                return template_list
+            with os.scandir(search_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
                 
-            for item in sorted(os.listdir(search_path)):
-                item_path = os.path.join(search_path, item)
-                relative_path = os.path.join(current_path, item) if current_path else item
+            for entry in entries:
+                relative_path = os.path.join(current_path, entry.name) if current_path else entry.name
                 
-                if os.path.isdir(item_path):
+                if entry.is_dir(follow_symlinks=False):
                     # It's a directory
-                    template_list.append({
-                        'name': item,
+                    dirs.append(entry.path)
+                    directory = {
+                        'name': entry.name,
                         'type': 'directory',
-                        'path': relative_path,
-                        'children': self.list_templates(relative_path)
-                    })
-                elif item.endswith('.txt'):
+                        'path': relative_path
+                    }
+                    if recursive:
+                        directory['children'] = self._scan_templates(relative_path, dirs)
+                    template_list.append(directory)
+                elif entry.name.endswith('.txt') and entry.is_file(follow_symlinks=False):
                     # It's a template file
                     template_list.append({
-                        'name': item,
+                        'name': entry.name,
                         'type': 'file',
                         'path': relative_path
                     })
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Error listing templates: {str(e)}")
+            logger.error("Error listing templates: %s", e)
             
         return template_list
 
@@ -628,15 +1504,24 @@ class TemplateManager:
         """Deletes a template file or an empty directory."""
         try:
             full_path = self._get_full_path(relative_path)
-            if os.path.isfile(full_path):
+            # One stat call tells both whether the path exists and what it is
+            try:
+                mode = os.stat(full_path).st_mode
+            except FileNotFoundError:
+                return False
+            if stat.S_ISREG(mode):
                 os.remove(full_path)
+                with self._content_lock:
+                    self._content_cache.pop(full_path, None)
+                self._invalidate_tree_cache()
                 return True
-            elif os.path.isdir(full_path):
+            elif stat.S_ISDIR(mode):
                 os.rmdir(full_path)  # Only removes empty directories
+                self._invalidate_tree_cache()
                 return True
             return False
         except Exception as e:
-            print(f"Error deleting template: {str(e)}")
+            logger.error("Error deleting template: %s", e)
             return False
 
     def rename_template(self, old_relative_path, new_relative_path):
@@ -647,13 +1532,17 @@ class TemplateManager:
             
             # Ensure parent directory of new path exists
             parent_dir = os.path.dirname(new_full_path)
-            if parent_dir and not os.path.exists(parent_dir):
-                os.makedirs(parent_dir)
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
             
             os.rename(old_full_path, new_full_path)
+            with self._content_lock:
+                self._content_cache.pop(old_full_path, None)
+                self._content_cache.pop(new_full_path, None)
+            self._invalidate_tree_cache()
             return True
         except Exception as e:
-            print(f"Error renaming template: {str(e)}")
+            logger.error("Error renaming template: %s", e)
             return False
 
 
@@ -663,6 +1552,8 @@ class InterfaceListItemWidget(QWidget):
     A custom widget for displaying an interface in the QListWidget, including a checkbox
     and status icon.
     """
+    check_toggled = pyqtSignal(str, bool) # Emitted with the interface name and new checked state
+
     def __init__(self, interface_name, status_icon, parent=None):
         super().__init__(parent)
         
@@ -690,6 +1581,7 @@ class InterfaceListItemWidget(QWidget):
         
         # Store interface name for external access
         self.interface_name = interface_name
+        self.checkbox.toggled.connect(lambda checked: self.check_toggled.emit(self.interface_name, checked))
 
     def get_interface_name(self):
         """Returns the name of the interface."""
@@ -720,7 +1612,7 @@ class TemplateSelectionDialog(QDialog):
         self.setModal(True)
         self.resize(400, 300)
         
-        self.template_manager = TemplateManager()
+        self.template_manager = TemplateManager.instance()
         self.selected_template = None
         
         layout = QVBoxLayout()
@@ -732,6 +1624,7 @@ class TemplateSelectionDialog(QDialog):
         self.tree_widget.setHeaderLabel("Şablonlar")
         self.tree_widget.itemClicked.connect(self._select_item)
         self.tree_widget.itemDoubleClicked.connect(self._handle_double_click)
+        self.tree_widget.itemExpanded.connect(self._on_expand)
         layout.addWidget(self.tree_widget)
         
         # Buttons
@@ -751,26 +1644,45 @@ class TemplateSelectionDialog(QDialog):
         
         self.load_templates()
 
-    def _add_tree_items(self, parent_item, data_list):
-        """Recursively adds items to the QTreeWidget."""
+    def _build_tree_items(self, data_list):
+        """
+        Builds detached items for one level of the tree, to be inserted in a single call.
+        Directories get a placeholder child so they can be expanded; their real children
+        are loaded in _on_expand.
+        """
+        tree_items = []
         for item_data in data_list:
-            tree_item = QTreeWidgetItem(parent_item)
+            tree_item = QTreeWidgetItem()
             tree_item.setText(0, item_data['name'])
             tree_item.setData(0, Qt.UserRole, item_data)
             
             if item_data['type'] == 'directory':
-                # Add children recursively
-                self._add_tree_items(tree_item, item_data['children'])
+                # Placeholder child (no item data) so the expand arrow appears
+                tree_item.addChild(QTreeWidgetItem())
             elif item_data['type'] == 'file':
                 # Make file items selectable (visually different)
                 tree_item.setData(0, Qt.UserRole + 1, 'selectable')
+            tree_items.append(tree_item)
+        return tree_items
 
     def load_templates(self):
-        """Loads template names and directories into the tree widget."""
-        self.tree_widget.clear()
-        templates_data = self.template_manager.list_templates()
-        self._add_tree_items(self.tree_widget, templates_data)
-        self.tree_widget.expandAll()
+        """Loads the top-level template names and directories into the tree widget."""
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tree_widget):
+                self.tree_widget.clear()
+                templates_data = self.template_manager.list_top_level()
+                self.tree_widget.addTopLevelItems(self._build_tree_items(templates_data))
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
+
+    def _on_expand(self, item):
+        """Replaces a directory's placeholder child with its contents the first time it is expanded."""
+        if item.childCount() != 1 or item.child(0).data(0, Qt.UserRole) is not None:
+            return
+        item.takeChild(0)
+        item_data = item.data(0, Qt.UserRole)
+        item.addChildren(self._build_tree_items(self.template_manager.list_top_level(item_data['path'])))
 
     def _select_item(self, item, column):
         """Handles single click to select an item."""
@@ -816,8 +1728,12 @@ class TemplateManagerDialog(QDialog):
         self.setModal(True)
         self.resize(800, 600)
         
-        self.template_manager = TemplateManager()
+        self.template_manager = TemplateManager.instance()
         self.current_template = None
+        # Template whose background load is awaited (older results are ignored)
+        self.pending_template = None
+        self.template_load_task = None
+        self.template_save_task = None
         
         layout = QHBoxLayout()
         
@@ -831,6 +1747,7 @@ class TemplateManagerDialog(QDialog):
         self.tree_widget.setHeaderLabel("Şablonlar ve Klasörler")
         self.tree_widget.itemClicked.connect(self.display_selected_template_content)
         self.tree_widget.itemDoubleClicked.connect(self.expand_or_display)
+        self.tree_widget.itemExpanded.connect(self._on_expand)
         left_layout.addWidget(self.tree_widget)
         
         # Management buttons
@@ -889,28 +1806,135 @@ class TemplateManagerDialog(QDialog):
             
             # Create empty template
             if self.template_manager.save_template(template_name, ""):
-                self.load_templates()
+                self._insert_tree_entry(template_name, 'file')
                 QMessageBox.information(self, "Başarılı", f"Şablon '{template_name}' oluşturuldu!")
             else:
                 QMessageBox.critical(self, "Hata", f"Şablon oluşturulamadı: {template_name}")
 
     def load_templates(self):
-        """Loads template names and directories into the tree widget."""
-        self.tree_widget.clear()
-        templates_data = self.template_manager.list_templates()
-        self._add_tree_items(self.tree_widget, templates_data)
-        self.tree_widget.expandAll()
-
-    def _add_tree_items(self, parent_item, data_list):
-        """Recursively adds items to the QTreeWidget."""
+        """
+        Loads the top-level template names and directories into the tree widget.
+        Directories that were expanded before the reload are expanded again.
+        """
+        expanded_paths = self._get_expanded_paths()
+        
+        # Insert the top level at once, with repaints and signals suspended
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tree_widget):
+                self.tree_widget.clear()
+                templates_data = self.template_manager.list_top_level()
+                self.tree_widget.addTopLevelItems(self._build_tree_items(templates_data))
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
+        
+        if expanded_paths:
+            self._expand_paths(self.tree_widget.invisibleRootItem(), expanded_paths)
+
+    def _get_expanded_paths(self):
+        """Returns the relative paths of all currently expanded directory items."""
+        expanded_paths = set()
+        pending = [self.tree_widget.invisibleRootItem()]
+        while pending:
+            parent = pending.pop()
+            for i in range(parent.childCount()):
+                child = parent.child(i)
+                item_data = child.data(0, Qt.UserRole)
+                if item_data and child.isExpanded():
+                    expanded_paths.add(item_data['path'])
+                    pending.append(child)
+        return expanded_paths
+
+    def _expand_paths(self, parent, expanded_paths):
+        """Re-expands the directory items below parent whose paths are in expanded_paths."""
+        for i in range(parent.childCount()):
+            child = parent.child(i)
+            item_data = child.data(0, Qt.UserRole)
+            if item_data and item_data['path'] in expanded_paths:
+                # Expanding populates the children through _on_expand
+                child.setExpanded(True)
+                self._expand_paths(child, expanded_paths)
+
+    def _build_tree_items(self, data_list):
+        """
+        Builds detached QTreeWidgetItems for one level of data_list. Directories get a
+        placeholder child so they can be expanded; their children are created in _on_expand.
+        """
+        tree_items = []
         for item_data in data_list:
-            tree_item = QTreeWidgetItem(parent_item)
+            tree_item = QTreeWidgetItem()
             tree_item.setText(0, item_data['name'])
             tree_item.setData(0, Qt.UserRole, item_data)
             
             if item_data['type'] == 'directory':
-                # Add children recursively
-                self._add_tree_items(tree_item, item_data['children'])
+                # Placeholder child (no item data) so the expand arrow appears
+                tree_item.addChild(QTreeWidgetItem())
+            tree_items.append(tree_item)
+        return tree_items
+
+    def _on_expand(self, item):
+        """Replaces a directory's placeholder child with its contents the first time it is expanded."""
+        if item.childCount() != 1 or item.child(0).data(0, Qt.UserRole) is not None:
+            return
+        item.takeChild(0)
+        item_data = item.data(0, Qt.UserRole)
+        item.addChildren(self._build_tree_items(self.template_manager.list_top_level(item_data['path'])))
+
+    def _is_populated(self, parent):
+        """Returns True if parent's children have been created (it no longer holds only the placeholder)."""
+        return not (parent.childCount() == 1 and parent.child(0).data(0, Qt.UserRole) is None)
+
+    def _find_child(self, parent, name):
+        """Returns the child item of parent with the given name, or None."""
+        for i in range(parent.childCount()):
+            item_data = parent.child(i).data(0, Qt.UserRole)
+            if item_data and item_data['name'] == name:
+                return parent.child(i)
+        return None
+
+    def _insert_tree_entry(self, relative_path, entry_type):
+        """
+        Adds a single new file or directory to the tree without rebuilding it. Nothing is
+        added below directories whose children have not been created yet; they list the
+        new entry when expanded. Falls back to load_templates() for unusual paths.
+        """
+        parts = os.path.normpath(relative_path).split(os.sep)
+        if any(part in ('', '.', '..') for part in parts):
+            self.load_templates()
+            return
+        
+        parent = self.tree_widget.invisibleRootItem()
+        path = ""
+        for depth, name in enumerate(parts):
+            path = os.path.join(path, name) if path else name
+            if not self._is_populated(parent):
+                return
+            child = self._find_child(parent, name)
+            
+            is_entry = (depth == len(parts) - 1)
+            if not is_entry and child is not None:
+                parent = child
+                continue
+            
+            if is_entry:
+                if child is not None:
+                    # The entry replaced an existing one with the same name
+                    parent.removeChild(child)
+                if entry_type == 'file' and not name.endswith('.txt'):
+                    # Not listed as a template (same rule as TemplateManager._scan_templates)
+                    return
+                item_type = entry_type
+            else:
+                # Directory created for the entry; its contents are listed when it is expanded
+                item_type = 'directory'
+            
+            # Keep the name order used by TemplateManager
+            index = 0
+            while index < parent.childCount() and parent.child(index).data(0, Qt.UserRole)['name'] < name:
+                index += 1
+            item_data = {'name': name, 'type': item_type, 'path': path}
+            parent.insertChild(index, self._build_tree_items([item_data])[0])
+            return
 
     def expand_or_display(self, item, column):
         """Handles double-click: expand/collapse directory or display file content."""
@@ -927,28 +1951,52 @@ class TemplateManagerDialog(QDialog):
         item_data = item.data(0, Qt.UserRole)
         if item_data and item_data['type'] == 'file':
             template_path = item_data['path']
-            content = self.template_manager.load_template(template_path)
-            if content is not None:
-                self.content_area.setPlainText(content)
-                self.current_template = template_path
-            else:
-                self.content_area.setPlainText("Şablon yüklenemedi.")
-                self.current_template = None
+            if template_path == self.current_template:
+                # Already displayed; keep the editor (and any unsaved edits) as it is
+                return
+            # Read the file on the shared thread pool; on_template_loaded fills the editor
+            self.pending_template = template_path
+            self.current_template = None
+            self.content_area.setPlainText("Yükleniyor...")
+            self.template_load_task = TemplateLoadRunnable(self.template_manager, template_path)
+            self.template_load_task.signals.completed.connect(self.on_template_loaded)
+            QThreadPool.globalInstance().start(self.template_load_task)
         else:
+            self.pending_template = None
             self.content_area.setPlainText("")
             self.current_template = None
 
+    def on_template_loaded(self, result):
+        """Shows a template loaded in the background, unless another one was selected since."""
+        template_path, content = result
+        if template_path != self.pending_template:
+            return
+        self.pending_template = None
+        if content is not None:
+            self.content_area.setPlainText(content)
+            self.current_template = template_path
+        else:
+            self.content_area.setPlainText("Şablon yüklenemedi.")
+            self.current_template = None
+
     def save_edited_template(self):
         """Saves the edited content of the currently displayed template."""
         if self.current_template:
             content = self.content_area.toPlainText()
-            if self.template_manager.save_template(self.current_template, content):
-                QMessageBox.information(self, "Başarılı", "Şablon kaydedildi!")
-            else:
-                QMessageBox.critical(self, "Hata", "Şablon kaydedilemedi!")
+            # Write the file on the shared thread pool; on_template_saved reports the result
+            self.template_save_task = TemplateSaveRunnable(self.template_manager, self.current_template, content)
+            self.template_save_task.signals.completed.connect(self.on_template_saved)
+            QThreadPool.globalInstance().start(self.template_save_task)
         else:
             QMessageBox.warning(self, "Uyarı", "Kaydetmek için bir şablon seçin.")
 
+    def on_template_saved(self, saved):
+        """Reports the result of a background template save."""
+        if saved:
+            QMessageBox.information(self, "Başarılı", "Şablon kaydedildi!")
+        else:
+            QMessageBox.critical(self, "Hata", "Şablon kaydedilemedi!")
+
     def delete_selected_template(self):
         """Deletes the selected template file or empty directory."""
         current_item = self.tree_widget.currentItem()
@@ -960,7 +2008,8 @@ class TemplateManagerDialog(QDialog):
                                            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
                 if reply == QMessageBox.Yes:
                     if self.template_manager.delete_template(item_data['path']):
-                        self.load_templates()
+                        parent = current_item.parent() or self.tree_widget.invisibleRootItem()
+                        parent.removeChild(current_item)
                         self.content_area.setPlainText("")
                         self.current_template = None
                         QMessageBox.information(self, "Başarılı", "Öğe silindi!")
@@ -984,7 +2033,10 @@ class TemplateManagerDialog(QDialog):
                     new_path = os.path.join(parent_path, new_name) if parent_path else new_name
                     
                     if self.template_manager.rename_template(old_path, new_path):
-                        self.load_templates()
+                        # Move the item instead of rebuilding the tree
+                        parent = current_item.parent() or self.tree_widget.invisibleRootItem()
+                        parent.removeChild(current_item)
+                        self._insert_tree_entry(new_path, item_data['type'])
                         if self.current_template == old_path:
                             self.current_template = new_path
                         QMessageBox.information(self, "Başarılı", "Öğe yeniden adlandırıldı!")
@@ -1003,7 +2055,7 @@ class InterfaceConfigDialog(QDialog):
         super().__init__(parent)
         self.connection = connection
         self.interface = interface
-        self.template_manager = TemplateManager()
+        self.template_manager = TemplateManager.instance()
         
         self.setWindowTitle(f"{interface} Konfigürasyonu")
         self.setModal(True)
@@ -1052,7 +2104,9 @@ class InterfaceConfigDialog(QDialog):
             if selected_template:
                 template_content = self.template_manager.load_template(selected_template)
                 if template_content:
-                    self.config_area.setPlainText(template_content)
+                    # Re-picking the template already in the editor keeps its undo history
+                    if self.config_area.toPlainText() != template_content:
+                        self.config_area.setPlainText(template_content)
                 else:
                     QMessageBox.critical(self, "Hata", "Şablon yüklenemedi!")
 
@@ -1064,14 +2118,35 @@ class InterfaceConfigDialog(QDialog):
             return
 
         try:
-            commands = [f"interface {self.interface}"] + config_text.split('\n') + ["exit"]
-            output = self.connection.send_config_set(commands)
+            commands = list(chain([f"interface {self.interface}"], config_text.splitlines(), ["exit"]))
+            with connection_lock(self.connection):
+                output = self.connection.send_config_set(commands)
+            invalidate_running_config(self.connection)
             QMessageBox.information(self, "Başarılı", f"{self.interface} konfigürasyonu uygulandı!")
             self.accept()
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Konfigürasyon uygulanırken hata oluştu: {str(e)}")
 
 
+# Common interface type mappings (abbreviation -> full type name)
+_IFACE_TYPE_MAP = {
+    'Gi': 'GigabitEthernet',
+    'Fa': 'FastEthernet',
+    'Et': 'Ethernet',
+    'Se': 'Serial',
+    'Lo': 'Loopback',
+    'Vl': 'Vlan',
+    'Tu': 'Tunnel'
+}
+
+# Full type names, longest first, checked with startswith before falling back to the regex
+_IFACE_FULL_TYPES = tuple(sorted(set(_IFACE_TYPE_MAP.values()), key=len, reverse=True))
+
+# Matches: Type + module/slot/port or Type + number
+_IFACE_NAME_RE = re.compile(r'^([A-Za-z]+)(\d+(?:/\d+)*)$')
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_interface_for_range(interface_name):
     """
     Parses an interface name into components suitable for an 'interface range' command.
@@ -1080,30 +2155,27 @@ def parse_interface_for_range(interface_name):
              "Fa0/1"              -> ("FastEthernet", "0", 1)
              "Loopback0"          -> ("Loopback", "", 0)
     """
-    # Common interface type mappings
-    type_mappings = {
-        'Gi': 'GigabitEthernet',
-        'Fa': 'FastEthernet',
-        'Et': 'Ethernet',
-        'Se': 'Serial',
-        'Lo': 'Loopback',
-        'Vl': 'Vlan',
-        'Tu': 'Tunnel'
-    }
+    # Fast path: a full type name followed by digits separated by '/'
+    type_part = number_part = None
+    for full_type_name in _IFACE_FULL_TYPES:
+        if interface_name.startswith(full_type_name):
+            rest = interface_name[len(full_type_name):]
+            if rest and all(part.isdecimal() for part in rest.split('/')):
+                type_part = full_type_name
+                number_part = rest
+            break
     
-    # Regular expression to parse interface names
-    # Matches: Type + module/slot/port or Type + number
-    pattern = r'^([A-Za-z]+)(\d+(?:/\d+)*(?:/\d+)?)$'
-    match = re.match(pattern, interface_name)
-    
-    if not match:
-        return interface_name, "", 0  # Return as-is if can't parse
-    
-    type_part = match.group(1)
-    number_part = match.group(2)
+    if type_part is None:
+        match = _IFACE_NAME_RE.match(interface_name)
+        
+        if not match:
+            return interface_name, "", 0  # Return as-is if can't parse
+        
+        type_part = match.group(1)
+        number_part = match.group(2)
     
     # Expand abbreviated type names
-    full_type = type_mappings.get(type_part, type_part)
+    full_type = _IFACE_TYPE_MAP.get(type_part, type_part)
     
     # Split the number part to get module and port
     if '/' in number_part:
@@ -1141,59 +2213,30 @@ def create_interface_range_string(selected_interfaces):
     if len(selected_interfaces) == 1:
         return f"interface {selected_interfaces[0]}"
     
-    # Group interfaces by type and module
-    interface_groups = {}
-    
+    # Group port numbers by interface type and module in a single pass
+    interface_groups = defaultdict(list)
     for interface in selected_interfaces:
         # Parse interface name (e.g., "GigabitEthernet1/0/1" -> "GigabitEthernet", "1/0", 1)
         full_type, module_part, port_number = parse_interface_for_range(interface)
-        
-        # Create group key
-        group_key = (full_type, module_part)
-        if group_key not in interface_groups:
-            interface_groups[group_key] = []
-        
-        interface_groups[group_key].append(port_number)
+        interface_groups[(full_type, module_part)].append(port_number)
     
     # Build range strings for each group
     range_parts = []
     
     for (interface_type, module_part), ports in interface_groups.items():
-        # Sort ports numerically
-        ports.sort()
-        
-        # Create contiguous ranges
-        ranges = []
-        start = ports[0]
-        end = ports[0]
+        # Interface with module (e.g., GigabitEthernet1/0/1) or without (e.g., Loopback1)
+        prefix = f"{interface_type}{module_part}/" if module_part else interface_type
         
-        for i in range(1, len(ports)):
-            if ports[i] == end + 1:
-                # Contiguous port, extend range
-                end = ports[i]
-            else:
-                # Gap found, save current range and start new one
-                ranges.append((start, end))
-                start = ports[i]
-                end = ports[i]
-        
-        # Add the last range
-        ranges.append((start, end))
-        
-        # Format ranges for this interface type
-        for start_port, end_port in ranges:
-            if module_part:
-                # Interface with module (e.g., GigabitEthernet1/0/1)
-                if start_port == end_port:
-                    range_parts.append(f"{interface_type}{module_part}/{start_port}")
-                else:
-                    range_parts.append(f"{interface_type}{module_part}/{start_port}-{end_port}")
+        # Sort ports numerically; contiguous ports share the same (port - position) value
+        ports.sort()
+        for _, run in groupby(enumerate(ports), key=lambda item: item[1] - item[0]):
+            run = list(run)
+            start_port = run[0][1]
+            end_port = run[-1][1]
+            if start_port == end_port:
+                range_parts.append(f"{prefix}{start_port}")
             else:
-                # Interface without module (e.g., Loopback1)
-                if start_port == end_port:
-                    range_parts.append(f"{interface_type}{start_port}")
-                else:
-                    range_parts.append(f"{interface_type}{start_port}-{end_port}")
+                range_parts.append(f"{prefix}{start_port}-{end_port}")
     
     # Join all range parts
     return f"interface range {', '.join(range_parts)}"
@@ -1223,7 +2266,9 @@ class BulkInterfaceConfigDialog(QDialog):
         super().__init__(parent)
         self.connection = connection
         self.interfaces = interfaces
-        self.template_manager = TemplateManager()
+        # The selection is fixed while the dialog is open, so build the range command once
+        self._range_command = create_interface_range_string(interfaces)
+        self.template_manager = TemplateManager.instance()
         
         self.setWindowTitle("Toplu Interface Konfigürasyonu")
         self.setModal(True)
@@ -1282,7 +2327,9 @@ class BulkInterfaceConfigDialog(QDialog):
             if selected_template:
                 template_content = self.template_manager.load_template(selected_template)
                 if template_content:
-                    self.config_area.setPlainText(template_content)
+                    # Re-picking the template already in the editor keeps its undo history
+                    if self.config_area.toPlainText() != template_content:
+                        self.config_area.setPlainText(template_content)
                 else:
                     QMessageBox.critical(self, "Hata", "Şablon yüklenemedi!")
 
@@ -1294,20 +2341,21 @@ class BulkInterfaceConfigDialog(QDialog):
             return
 
         try:
-            # Generate interface range command
-            range_command = create_interface_range_string(self.interfaces)
-            print(f"DEBUG: Generated range command: {range_command}")
+            # Interface range command generated when the dialog was opened
+            range_command = self._range_command
+            logger.debug("Generated range command: %s", range_command)
             
-            # Prepare configuration commands
-            config_lines = config_text.split('\n')
-            commands = [range_command] + config_lines + ["exit"]
+            # Prepare configuration commands (one list, no intermediate copies)
+            commands = list(chain([range_command], config_text.splitlines(), ["exit"]))
             
-            print(f"DEBUG: Applying commands: {commands}")
+            logger.debug("Applying commands: %s", commands)
             
             # Apply configuration using interface range
-            output = self.connection.send_config_set(commands)
+            with connection_lock(self.connection):
+                output = self.connection.send_config_set(commands)
+            invalidate_running_config(self.connection)
             
-            print(f"DEBUG: Configuration output: {output}")
+            logger.debug("Configuration output: %s", output)
             
             QMessageBox.information(self, "Başarılı", 
                                   f"{len(self.interfaces)} interface'e konfigürasyon başarıyla uygulandı!\n\n"
@@ -1315,7 +2363,7 @@ class BulkInterfaceConfigDialog(QDialog):
             self.accept()
             
         except Exception as e:
-            print(f"DEBUG: Error in bulk configuration: {str(e)}")
+            logger.error("Error in bulk configuration: %s", e)
             QMessageBox.critical(self, "Hata", 
                                f"Toplu konfigürasyon uygulanırken hata oluştu: {str(e)}\n\n"
                                f"Denenen komut: {range_command if 'range_command' in locals() else 'Bilinmiyor'}")
@@ -1329,7 +2377,7 @@ class GlobalConfigDialog(QDialog):
     def __init__(self, connection, parent=None):
         super().__init__(parent)
         self.connection = connection
-        self.template_manager = TemplateManager()
+        self.template_manager = TemplateManager.instance()
         
         self.setWindowTitle("Global Konfigürasyon")
         self.setModal(True)
@@ -1385,7 +2433,9 @@ class GlobalConfigDialog(QDialog):
             if selected_template:
                 template_content = self.template_manager.load_template(selected_template)
                 if template_content:
-                    self.config_area.setPlainText(template_content)
+                    # Re-picking the template already in the editor keeps its undo history
+                    if self.config_area.toPlainText() != template_content:
+                        self.config_area.setPlainText(template_content)
                 else:
                     QMessageBox.critical(self, "Hata", "Şablon yüklenemedi!")
 
@@ -1397,10 +2447,12 @@ class GlobalConfigDialog(QDialog):
             return
 
         try:
-            commands = config_text.split('\n')
+            commands = config_text.splitlines()
             self.console_output.append(f"> Applying {len(commands)} commands...")
             
-            output = self.connection.send_config_set(commands)
+            with connection_lock(self.connection):
+                output = self.connection.send_config_set(commands)
+            invalidate_running_config(self.connection)
             self.console_output.append(f"> Configuration applied successfully!")
             self.console_output.append(f"> Output:\n{output}")
             
@@ -1411,23 +2463,115 @@ class GlobalConfigDialog(QDialog):
             QMessageBox.critical(self, "Hata", f"Konfigürasyon uygulanırken hata oluştu: {str(e)}")
 
 
+# Optional override icon file (resolved once, relative to the start-up directory) and fallback
+# colour for each interface status
+_IFACE_STATUS_ICONS = {
+    "up": (os.path.abspath("green_icon.png"), Qt.green),
+    "down": (os.path.abspath("red_icon.png"), Qt.red),
+    "administratively down": (os.path.abspath("black_icon.png"), Qt.black),
+}
+
+# Built-in 16x16 PNG images for the status icons, used when no override file exists
+_IFACE_STATUS_ICON_PNGS = {
+    "up": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00\x90\x91h6\x00\x00\x00\x15IDATx\xdac`\xf8\xcf@\x1a\x1a\xd50\xaaa\xf8j\x00\x00\x91\xea\xff\x01\x95\x7f\xd8O\x00\x00\x00\x00IEND\xaeB`\x82',
+    "down": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00\x90\x91h6\x00\x00\x00\x16IDATx\xdac\xf8\xcf\xc0@\x12b\x18\xd50\xaaa\xf8j\x00\x00\x90\xf9\xff\x01\xf2\xee\xe8W\x00\x00\x00\x00IEND\xaeB`\x82',
+    "administratively down": b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00\x90\x91h6\x00\x00\x00\x10IDATx\xdac`\x18\x05\xa3`\x14\xc0\x00\x00\x03\x10\x00\x01\xd7-\x84c\x00\x00\x00\x00IEND\xaeB`\x82',
+}
+
+# The 'hostname' line of the running configuration (not other lines that mention the word)
+_HOSTNAME_RE = re.compile(r'^\s*hostname\s+(\S+)', re.MULTILINE)
+
+# Item data role holding the VLAN ID of a VLAN list entry
+VLAN_ID_ROLE = Qt.UserRole
+
+
+def classify_interface_status(status, protocol):
+    """
+    Returns 'administratively down', 'down', 'up' or 'unknown' from the first word of the
+    Status column and the Protocol column of a 'show ip interface brief' row.
+    Any 'down' outranks 'up', and an administrative shutdown outranks both.
+    """
+    status = status.lower()
+    protocol = protocol.lower()
+    if status == "administratively":
+        return "administratively down"
+    if status == "down" or protocol == "down":
+        return "down"
+    if status == "up" or protocol == "up":
+        return "up"
+    return "unknown"
+
+
 # SwitchTabWidget Class - Content of the Tabs
 class SwitchTabWidget(QWidget):
     """
     Tabbed widget representing each switch connection.
     Contains the functionality for the right and middle parts of the CiscoSwitchGUI.
     """
+    # Status icons shared by every tab, built when the first tab opens
+    _shared_status_icons = None
+
     def __init__(self, ip, username, password, parent=None):
         super().__init__(parent)
         self.ip = ip
         self.username = username
         self.password = password
         self.connection = None
-        self.config_manager = ConfigManager()
-        self.template_manager = TemplateManager()
+        # Login in progress, if any (see connect_to_switch)
+        self.connect_worker = None
+        self.config_manager = ConfigManager.instance()
+        self.template_manager = TemplateManager.instance()
+
+        # Switch commands run on this pool, one at a time and in order, so the GUI thread never
+        # waits for SSH while separate tabs still talk to their switches in parallel
+        self.command_pool = QThreadPool(self)
+        self.command_pool.setMaxThreadCount(1)
+        self._command_workers = set()
+
+        # Names of checked interfaces, kept up to date by on_interface_check_toggled
+        self._checked_ifaces = set()
+        # Row of each listed interface, used to hand checked interfaces over in list order
+        self._interface_rows = {}
+        # Widgets of the GigabitEthernet interfaces, for the select-all checkbox
+        self._gigabit_widgets = []
+
+        # One shared icon per interface status, so building the list does no file checks or drawing
+        if SwitchTabWidget._shared_status_icons is None:
+            status_icons = {}
+            for status in ("up", "down", "administratively down", "unknown"):
+                try:
+                    status_icons[status] = self.create_interface_icon(status)
+                except Exception as e:
+                    logger.error("Error creating interface icon for status %s: %s", status, e)
+                    status_icons[status] = QIcon() # Fallback to empty icon on error
+            SwitchTabWidget._shared_status_icons = status_icons
+        self._status_icons = SwitchTabWidget._shared_status_icons
+
+        # Coalesce selection changes (e.g. a Shift-click across many rows) into one button update
+        self.bulk_button_timer = QTimer(self)
+        self.bulk_button_timer.setSingleShot(True)
+        self.bulk_button_timer.setInterval(SELECTION_DEBOUNCE_MS)
+        self.bulk_button_timer.timeout.connect(self.update_bulk_apply_button)
+
+        # Only the last of several quick clicks fetches the interface configuration
+        self.pending_detail_interface = None
+        # LRU of interface configurations: {interface_name: (config_generation, output)}
+        self._iface_cfg_cache = OrderedDict()
+        self.detail_timer = QTimer(self)
+        self.detail_timer.setSingleShot(True)
+        self.detail_timer.setInterval(SELECTION_DEBOUNCE_MS)
+        self.detail_timer.timeout.connect(self.fetch_interface_details)
 
         self.initUI()
-        self.connect_to_switch()
+        # Log in when the tab is first shown (see showEvent), not when it is created
+        self.connect_pending = True
+
+    def showEvent(self, event):
+        """Starts the switch login the first time the tab becomes visible."""
+        super().showEvent(event)
+        if self.connect_pending:
+            self.connect_pending = False
+            self.connect_to_switch()
 
     def initUI(self):
         main_layout = QHBoxLayout(self)
@@ -1448,11 +2592,13 @@ class SwitchTabWidget(QWidget):
         
         interface_v_layout.addWidget(QLabel('Interface Listesi'))
         self.interface_list = QListWidget()
+        # Every row has the same height, so the view can lay rows out without measuring each one
+        self.interface_list.setUniformItemSizes(True)
         self.interface_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.interface_list.customContextMenuRequested.connect(self.show_context_menu)
         self.interface_list.itemDoubleClicked.connect(self.open_interface_config)
         self.interface_list.itemClicked.connect(self.show_interface_details)
-        self.interface_list.itemSelectionChanged.connect(self.update_bulk_apply_button)
+        self.interface_list.itemSelectionChanged.connect(self.bulk_button_timer.start)
         interface_v_layout.addWidget(self.interface_list)
 
         list_display_layout.addLayout(interface_v_layout)
@@ -1543,41 +2689,58 @@ class SwitchTabWidget(QWidget):
                 interface_name = custom_widget.get_interface_name()
                 context_menu = QMenu(self)
                 
-                default_action = QAction(f"Default {interface_name}", self)
+                default_action = QAction(f"Default {interface_name}", context_menu)
                 default_action.triggered.connect(lambda: self.default_interface(interface_name))
                 context_menu.addAction(default_action)
 
-                add_template_action = QAction(f"Şablona Ekle", self)
+                add_template_action = QAction(f"Şablona Ekle", context_menu)
                 add_template_action.triggered.connect(lambda: self.add_interface_to_template(interface_name))
                 context_menu.addAction(add_template_action)
                 
                 context_menu.exec_(self.interface_list.viewport().mapToGlobal(position))
+                # Free the menu, its actions and their closures now instead of when the tab closes
+                context_menu.deleteLater()
 
     def add_interface_to_template(self, interface_name):
         """Fetches interface config and saves it as a template."""
         if self.connection:
-            try:
-                config_output = self.connection.send_command(f"show running-config interface {interface_name}")
-                
-                template_name, ok = QInputDialog.getText(self, "Şablona Ekle", 
-                                                         f"Şablon için bir isim girin (örn: klasör/isim):", 
-                                                         QLineEdit.Normal, interface_name.replace("/", "_").replace(" ", "_"))
-                if ok and template_name:
-                    if not template_name.endswith(".txt"):
-                        template_name += ".txt"
-
-                    if self.template_manager.save_template(template_name, config_output):
-                        QMessageBox.information(self, "Başarılı", f"Arayüz konfigürasyonu '{template_name}' şablonu olarak kaydedildi!")
-                    else:
-                        QMessageBox.critical(self, "Hata", f"Şablon kaydedilirken bir hata oluştu: {template_name}")
-                elif not template_name and ok:
-                    QMessageBox.warning(self, "Uyarı", "Şablon adı boş bırakılamaz.")
+            cached = self._cached_interface_config(interface_name)
+            if cached is not None:
+                self._prompt_and_save_template(interface_name, cached)
+                return
 
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Arayüz konfigürasyonu alınırken hata oluştu: {str(e)}")
+            generation = config_generation(self.connection)
+            self.run_command(f"show running-config interface {interface_name}",
+                             lambda output: self.on_template_interface_fetched(interface_name, generation, output),
+                             self.on_template_interface_error)
         else:
             QMessageBox.warning(self, "Uyarı", "Önce switch'e bağlanın!")
 
+    def on_template_interface_fetched(self, interface_name, generation, output):
+        """Remembers the fetched interface configuration and offers to save it as a template."""
+        self._remember_interface_config(interface_name, generation, output)
+        self._prompt_and_save_template(interface_name, output)
+
+    def on_template_interface_error(self, error_message):
+        """Reports a failure to fetch the interface configuration for a template."""
+        QMessageBox.critical(self, "Hata", f"Arayüz konfigürasyonu alınırken hata oluştu: {error_message}")
+
+    def _prompt_and_save_template(self, interface_name, config_output):
+        """Asks for a template name and saves the interface configuration under it."""
+        template_name, ok = QInputDialog.getText(self, "Şablona Ekle", 
+                                                 f"Şablon için bir isim girin (örn: klasör/isim):", 
+                                                 QLineEdit.Normal, interface_name.replace("/", "_").replace(" ", "_"))
+        if ok and template_name:
+            if not template_name.endswith(".txt"):
+                template_name += ".txt"
+
+            if self.template_manager.save_template(template_name, config_output):
+                QMessageBox.information(self, "Başarılı", f"Arayüz konfigürasyonu '{template_name}' şablonu olarak kaydedildi!")
+            else:
+                QMessageBox.critical(self, "Hata", f"Şablon kaydedilirken bir hata oluştu: {template_name}")
+        elif not template_name and ok:
+            QMessageBox.warning(self, "Uyarı", "Şablon adı boş bırakılamaz.")
+
 
     def default_interface(self, interface_name):
         """Resets the selected interface to its default configuration."""
@@ -1591,7 +2754,9 @@ class SwitchTabWidget(QWidget):
                         f"default interface {interface_name}",
                         "end"
                     ]
-                    output = self.connection.send_config_set(commands)
+                    with connection_lock(self.connection):
+                        output = self.connection.send_config_set(commands)
+                    invalidate_running_config(self.connection)
                     self.output_area.append(f'\n> default interface {interface_name}\n{output}')
                     QMessageBox.information(self, "Başarılı", f"Interface {interface_name} varsayılan ayarlarına döndürüldü.")
                     self.load_interfaces()
@@ -1602,83 +2767,153 @@ class SwitchTabWidget(QWidget):
             QMessageBox.warning(self, "Uyarı", "Önce switch'e bağlanın!")
 
     def connect_to_switch(self):
-        """Establishes an SSH connection to the switch using Netmiko."""
-        print(f"DEBUG: Attempting to connect to {self.ip}...")
-        if self.connection:
-            print(f"DEBUG: Already connected to {self.ip}.")
+        """Starts establishing an SSH connection to the switch using Netmiko on a worker thread."""
+        logger.debug("Attempting to connect to %s...", self.ip)
+        if self.connection or self.connect_worker:
+            logger.debug("Already connected to %s.", self.ip)
             self.output_area.append(f'Uyarı: Zaten {self.ip} adresine bağlısınız.')
             return
 
         self.device = {
             'device_type': 'cisco_ios',
             'host': self.ip,
+            'port': 22,
             'username': self.username,
             'password': self.password,
             'timeout': 10
         }
 
-        try:
-            print("DEBUG: Calling ConnectHandler...")
-            self.connection = ConnectHandler(**self.device)
-            print("DEBUG: ConnectHandler successful.")
-            self.output_area.append('Bağlantı başarılı!')
-            self.command_input.setEnabled(True)
-            self.backup_button.setEnabled(True)
-            self.apply_global_config_button.setEnabled(True)
-            self.bulk_apply_button.setEnabled(True)
-            self.gigabit_checkbox.setEnabled(True)
-            self.search_interface_checkbox.setEnabled(True)
-
-            print("DEBUG: Fetching hostname...")
-            hostname_output = self.connection.send_command("show running-config | include hostname")
-            print(f"DEBUG: Hostname raw output: {hostname_output.strip()}") # More specific debug
-
-            hostname = ""
-            if "hostname" in hostname_output:
-                hostname = hostname_output.split("hostname")[1].strip()
-            
-            if hostname:
-                print(f"DEBUG: Hostname parsed: {hostname}")
-                parent_tab_widget = self.parentWidget()
-                if parent_tab_widget and isinstance(parent_tab_widget, QTabWidget):
-                    tab_index = parent_tab_widget.indexOf(self)
-                    if tab_index != -1:
-                        parent_tab_widget.setTabText(tab_index, f"{self.ip} ({hostname})")
-                        print(f"DEBUG: Tab text updated to: {self.ip} ({hostname})")
-
-            print("DEBUG: Loading interfaces and VLANs...")
-            self.load_interfaces()
-            self.load_vlans()
-            print("DEBUG: Connection process completed successfully.")
-
-        except NetmikoAuthenticationException:
+        logger.debug("Acquiring connection from pool...")
+        worker = ConnectRunnable(
+            self.ip, self.device['port'], self.username, self.password,
+            self.device['device_type'], self.device['timeout']
+        )
+        worker.signals.completed.connect(lambda connection: self.on_switch_connected(worker, connection))
+        worker.signals.error.connect(lambda error_message: self.on_connect_failed(worker))
+        self.connect_worker = worker
+        ConnectRunnable.thread_pool().start(worker)
+
+    def on_switch_connected(self, worker, connection):
+        """Enables the tab once the login has finished and loads the switch state."""
+        if worker is not self.connect_worker:
+            return  # The tab was closed while logging in; disconnect_from_switch released it
+        self.connect_worker = None
+        self.connection = connection
+        logger.debug("Connection acquired.")
+        self.output_area.append('Bağlantı başarılı!')
+        self.command_input.setEnabled(True)
+        self.backup_button.setEnabled(True)
+        self.apply_global_config_button.setEnabled(True)
+        self.bulk_apply_button.setEnabled(True)
+        self.gigabit_checkbox.setEnabled(True)
+        self.search_interface_checkbox.setEnabled(True)
+
+        logger.debug("Fetching hostname, interfaces and VLANs...")
+        self._bootstrap_switch_state()
+        logger.debug("Connection process completed successfully.")
+
+    def on_connect_failed(self, worker):
+        """Reports why the login failed."""
+        if worker is not self.connect_worker:
+            return
+        self.connect_worker = None
+        if isinstance(worker.exception, NetmikoAuthenticationException):
             error_msg = f"Kimlik doğrulama hatası: {self.ip}"
-            print(f"DEBUG: {error_msg}")
-            self.output_area.append(error_msg)
-        except NetmikoTimeoutException:
+        elif isinstance(worker.exception, NetmikoTimeoutException):
             error_msg = f"Bağlantı zaman aşımı: {self.ip}"
-            print(f"DEBUG: {error_msg}")
-            self.output_area.append(error_msg)
-        except Exception as e:
-            error_msg = f"Bağlantı hatası: {str(e)}"
-            print(f"DEBUG: {error_msg}")
-            self.output_area.append(error_msg)
+        else:
+            error_msg = f"Bağlantı hatası: {str(worker.exception)}"
+        logger.error("%s", error_msg)
+        self.output_area.append(error_msg)
+
+    def run_command(self, command, on_completed, on_error):
+        """
+        Runs a show command on the tab's command pool. on_completed(output) or on_error(message)
+        is called on the GUI thread. Returns the worker.
+        """
+        return self._start_worker(NetmikoWorker(self.connection, command), on_completed, on_error)
+
+    def _start_worker(self, worker, on_completed, on_error):
+        """Connects the worker's signals and queues it on the tab's command pool."""
+        worker.signals.completed.connect(on_completed)
+        worker.signals.error.connect(on_error)
+        worker.signals.finished.connect(lambda: self._command_workers.discard(worker))
+        self._command_workers.add(worker)
+        self.command_pool.start(worker)
+        return worker
+
+    def _bootstrap_switch_state(self):
+        """Fetches the hostname, interface list and VLAN list in a single submission."""
+        commands = ["show running-config | include hostname", "show ip interface brief", "show vlan brief"]
+        return self._start_worker(NetmikoBatchWorker(self.connection, commands),
+                                  self.on_bootstrap_completed, self.on_bootstrap_error)
+
+    def on_bootstrap_completed(self, outputs):
+        """Hands each block of the batched output to its parser."""
+        hostname_output, interfaces_output, vlans_output = outputs
+        self.apply_hostname(hostname_output)
+        self.populate_interface_list(interfaces_output)
+        self.populate_vlan_list(vlans_output)
+
+    def on_bootstrap_error(self, error_message):
+        """Falls back to sending the startup commands one at a time."""
+        logger.warning("Batched startup commands failed (%s), retrying one by one.", error_message)
+        if not self.connection:
+            return
+        self.run_command("show running-config | include hostname", self.apply_hostname, self.on_connect_command_error)
+        self.load_interfaces()
+        self.load_vlans()
+
+    def apply_hostname(self, hostname_output):
+        """Shows the hostname returned by the switch in the tab title."""
+        logger.debug("Hostname raw output: %s", hostname_output.strip())
+
+        match = _HOSTNAME_RE.search(hostname_output)
+        hostname = match.group(1) if match else ""
+        
+        if hostname:
+            logger.debug("Hostname parsed: %s", hostname)
+            parent_tab_widget = self.parentWidget()
+            if parent_tab_widget and isinstance(parent_tab_widget, QTabWidget):
+                tab_index = parent_tab_widget.indexOf(self)
+                if tab_index != -1:
+                    parent_tab_widget.setTabText(tab_index, f"{self.ip} ({hostname})")
+                    logger.debug("Tab text updated to: %s (%s)", self.ip, hostname)
+
+    def on_connect_command_error(self, error_message):
+        """Reports a failure of the hostname query sent right after connecting."""
+        error_msg = f"Bağlantı hatası: {error_message}"
+        logger.error("%s", error_msg)
+        self.output_area.append(error_msg)
 
     def disconnect_from_switch(self):
-        """Disconnects from the switch. This method should only be called automatically when the tab is closed."""
+        """
+        Releases the switch connection back to the pool, which closes it once it has been idle.
+        This method should only be called automatically when the tab is closed.
+        """
+        if self.connect_worker:
+            # Still logging in: the worker releases the session itself unless it already handed it over
+            connection = self.connect_worker.cancel()
+            self.connect_worker = None
+            if connection:
+                ConnectionPool.instance().release(connection)
         if self.connection:
+            # Drop switch commands that have not started yet
+            self.command_pool.clear()
+            self._iface_cfg_cache.clear()
             try:
-                print(f"DEBUG: Disconnecting from {self.ip}...")
-                self.connection.disconnect()
-                print(f"DEBUG: Successfully disconnected from {self.ip}.")
+                logger.debug("Releasing connection to %s...", self.ip)
+                ConnectionPool.instance().release(self.connection)
+                logger.debug("Connection to %s returned to pool.", self.ip)
             except Exception as e:
-                print(f"DEBUG: Error during disconnect from {self.ip}: {str(e)}")
+                logger.error("Error during disconnect from %s: %s", self.ip, e)
             finally:
                 self.connection = None
 
     def clear_network_info_displays(self):
         """Clears interface and VLAN lists and information display."""
-        self.interface_list.clear()
+        self._clear_interface_list()
+        self.update_bulk_apply_button()
         self.vlan_list.clear()
         if hasattr(self, 'interface_info'):
             self.interface_info.clear()
@@ -1686,16 +2921,25 @@ class SwitchTabWidget(QWidget):
     def backup_current_config(self):
         """Initiates a backup of the current running configuration of the connected switch."""
         if self.connection:
-            filename = self.config_manager.backup_config(self.connection, self.ip)
-            if filename:
-                self.output_area.append(f'Yedekleme tamamlandı: {filename}')
-                QMessageBox.information(self, "Yedekleme", f"Konfigürasyon '{filename}' dosyasına kaydedildi.")
-            else:
-                self.output_area.append('Yedekleme hatası!')
-                QMessageBox.critical(self, "Hata", "Konfigürasyon yedeklenirken hata oluştu.")
+            self.backup_button.setEnabled(False)
+            self.output_area.append('Konfigürasyon yedekleniyor...')
+            self.backup_worker = BackupRunnable(self.config_manager, self.connection, self.ip)
+            self.backup_worker.signals.completed.connect(self.on_backup_completed)
+            QThreadPool.globalInstance().start(self.backup_worker)
         else:
             self.output_area.append("Önce switch'e bağlanın!")
 
+    def on_backup_completed(self, filename):
+        """Reports the result of a backup started by backup_current_config."""
+        self.backup_worker = None
+        self.backup_button.setEnabled(self.connection is not None)
+        if filename:
+            self.output_area.append(f'Yedekleme tamamlandı: {filename}')
+            QMessageBox.information(self, "Yedekleme", f"Konfigürasyon '{filename}' dosyasına kaydedildi.")
+        else:
+            self.output_area.append('Yedekleme hatası!')
+            QMessageBox.critical(self, "Hata", "Konfigürasyon yedeklenirken hata oluştu.")
+
     def open_global_config_dialog(self):
         """Opens the global configuration dialog."""
         if self.connection:
@@ -1708,18 +2952,13 @@ class SwitchTabWidget(QWidget):
         """
         Opens a dialog to apply configuration to selected interfaces.
         """
-        selected_interfaces = []
-        for i in range(self.interface_list.count()):
-            item = self.interface_list.item(i)
-            custom_widget = self.interface_list.itemWidget(item)
-            if custom_widget and custom_widget.is_checked():
-                selected_interfaces.append(custom_widget.get_interface_name())
-
-        if not selected_interfaces:
+        if not self._checked_ifaces:
             QMessageBox.warning(self, "Uyarı", "Lütfen en az bir interface seçin.")
             return
 
         if self.connection:
+            # Hand the checked interfaces over in list order
+            selected_interfaces = sorted(self._checked_ifaces, key=self._interface_rows.get)
             bulk_dialog = BulkInterfaceConfigDialog(self.connection, selected_interfaces, self)
             bulk_dialog.exec_()
         else:
@@ -1727,120 +2966,148 @@ class SwitchTabWidget(QWidget):
 
     def update_bulk_apply_button(self):
         """Enables/disables the bulk apply button based on interface selection."""
-        has_selection = False
-        for i in range(self.interface_list.count()):
-            item = self.interface_list.item(i)
-            custom_widget = self.interface_list.itemWidget(item)
-            if custom_widget and custom_widget.is_checked():
-                has_selection = True
-                break
-        self.bulk_apply_button.setEnabled(has_selection)
+        self.bulk_apply_button.setEnabled(bool(self._checked_ifaces))
+
+    def on_interface_check_toggled(self, interface_name, checked):
+        """Keeps the set of checked interfaces current and updates the bulk apply button."""
+        if checked:
+            self._checked_ifaces.add(interface_name)
+        else:
+            self._checked_ifaces.discard(interface_name)
+        self.update_bulk_apply_button()
+
+    def _clear_interface_list(self):
+        """Removes all interfaces (and their checkboxes) from the list and resets the checked set."""
+        self.interface_list.clear()
+        self._checked_ifaces.clear()
+        self._interface_rows.clear()
+        self._gigabit_widgets.clear()
 
     def toggle_gigabit_selection(self, state):
         """
         Toggles the selection of all GigabitEthernet interfaces based on checkbox state.
         """
         is_checked = (state == Qt.Checked)
-        for i in range(self.interface_list.count()):
-            item = self.interface_list.item(i)
-            custom_widget = self.interface_list.itemWidget(item)
-            if custom_widget:
-                interface_name = custom_widget.get_interface_name()
-                if "GigabitEthernet" in interface_name or "Gi" in interface_name:
-                    custom_widget.set_checked(is_checked)
+        for custom_widget in self._gigabit_widgets:
+            custom_widget.set_checked(is_checked)
         
         # Update bulk apply button state
         self.update_bulk_apply_button()
 
     def load_interfaces(self):
         """Loads and displays the list of interfaces from the switch."""
-        print("DEBUG: Starting load_interfaces...")
+        logger.debug("Starting load_interfaces...")
         if self.connection:
-            try:
-                print("DEBUG: Sending 'show ip interface brief' command...")
-                output = self.connection.send_command("show ip interface brief")
-                print("DEBUG: 'show ip interface brief' command successful.")
-                self.interface_list.clear()
-                lines = output.split('\n')
-                data_lines = [line.strip() for line in lines if line.strip() and not line.strip().startswith("Interface")]
-
-                for line in data_lines:
-                    columns = line.split()
-                    if len(columns) >= 6:
-                        interface_name = columns[0]
-                        status = "unknown" 
-                        if "up" in line.lower() and "down" not in line.lower():
-                            status = "up"
-                        elif "down" in line.lower() and "administratively" not in line.lower():
-                            status = "down"
-                        elif "administratively down" in line.lower():
-                            status = "administratively down"
-                        
-                        try:
-                            status_icon = self.create_interface_icon(status)
-                        except Exception as e:
-                            print(f"DEBUG: Error creating interface icon for {interface_name}: {str(e)}")
-                            status_icon = QIcon() # Fallback to empty icon on error
+            logger.debug("Sending 'show ip interface brief' command...")
+            self.run_command("show ip interface brief", self.populate_interface_list, self.on_load_interfaces_error)
+        else:
+            logger.debug("Not connected to switch in load_interfaces, clearing list.")
+            self._clear_interface_list()
+            self.update_bulk_apply_button()
 
+    def populate_interface_list(self, output):
+        """Fills the interface list from the output of 'show ip interface brief'."""
+        logger.debug("'show ip interface brief' command successful.")
+        try:
+            rows = []
+            for line in output.splitlines():
+                line = line.strip()
+                if not line or line.startswith("Interface"):
+                    continue
+                # Name, IP-Address, OK?, Method and the rest (Status and Protocol), split once
+                columns = line.split(None, 4)
+                if len(columns) == 5:
+                    # Status is one word, or two for "administratively down"; Protocol is last
+                    state = columns[4].split()
+                    if len(state) >= 2:
+                        status = classify_interface_status(state[0], state[-1])
+                        rows.append((columns[0], self._status_icons[status]))
+
+            # All rows share the size hint of the widest one instead of measuring each widget
+            shared_hint = None
+            if rows:
+                widest_name = max((name for name, _ in rows), key=len)
+                sample_widget = InterfaceListItemWidget(widest_name, self._status_icons["unknown"])
+                shared_hint = sample_widget.sizeHint()
+                sample_widget.deleteLater()
+
+            # Rebuild the list without per-item signals or repaints
+            self.interface_list.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.interface_list):
+                    self._clear_interface_list()
+                    for interface_name, status_icon in rows:
                         list_item = QListWidgetItem(self.interface_list)
                         custom_widget = InterfaceListItemWidget(interface_name, status_icon)
                         
-                        list_item.setSizeHint(custom_widget.sizeHint())
+                        custom_widget.check_toggled.connect(self.on_interface_check_toggled)
+                        self._interface_rows[interface_name] = len(self._interface_rows)
+                        if interface_name.startswith("Gi"):
+                            self._gigabit_widgets.append(custom_widget)
+                        
+                        list_item.setSizeHint(shared_hint)
                         self.interface_list.setItemWidget(list_item, custom_widget)
-                print("DEBUG: load_interfaces completed successfully.")
-            except Exception as e:
-                print(f"DEBUG: Error in load_interfaces: {str(e)}")
-                self.output_area.append(f'Hata interface yüklenirken: {str(e)}')
-        else:
-            print("DEBUG: Not connected to switch in load_interfaces, clearing list.")
-            self.interface_list.clear()
+            finally:
+                self.interface_list.setUpdatesEnabled(True)
+            self.update_bulk_apply_button()
+            logger.debug("load_interfaces completed successfully.")
+        except Exception as e:
+            self.on_load_interfaces_error(str(e))
+
+    def on_load_interfaces_error(self, error_message):
+        """Reports a failure to load the interface list."""
+        logger.error("Error in load_interfaces: %s", error_message)
+        self.output_area.append(f'Hata interface yüklenirken: {error_message}')
 
     def create_interface_icon(self, status):
-        """Creates and returns a QIcon based on the interface status."""
-        icon_path = ""
-        if "up" in status.lower() and "down" not in status.lower():
-            icon_path = "green_icon.png"
-        elif "down" in status.lower() and "administratively" not in status.lower():
-            icon_path = "red_icon.png"
-        elif "administratively down" in status.lower():
-            icon_path = "black_icon.png"
-        
-        if icon_path:
-            full_icon_path = os.path.abspath(icon_path) 
-            if os.path.exists(full_icon_path):
-                return QIcon(full_icon_path)
+        """Creates and returns a QIcon for a status returned by classify_interface_status."""
+        icon_path, color = _IFACE_STATUS_ICONS.get(status, ("", Qt.gray))
+        
+        if icon_path and os.path.exists(icon_path):
+            return QIcon(icon_path)
+        
+        png_data = _IFACE_STATUS_ICON_PNGS.get(status)
+        if png_data:
+            pixmap = QPixmap()
+            if pixmap.loadFromData(png_data, "PNG"):
+                return QIcon(pixmap)
         
         # Create a simple colored pixmap as fallback
         pixmap = QPixmap(16, 16)
-        if "up" in status.lower() and "down" not in status.lower():
-            pixmap.fill(Qt.green)
-        elif "down" in status.lower() and "administratively" not in status.lower():
-            pixmap.fill(Qt.red)
-        elif "administratively down" in status.lower():
-            pixmap.fill(Qt.black)
-        else:
-            pixmap.fill(Qt.gray)
+        pixmap.fill(color)
         
         return QIcon(pixmap)
 
     def load_vlans(self):
         """Loads and displays the list of VLANs from the switch."""
         if self.connection:
+            self.run_command("show vlan brief", self.populate_vlan_list, self.on_load_vlans_error)
+        else:
+            self.vlan_list.clear()
+
+    def populate_vlan_list(self, output):
+        """Fills the VLAN list from the output of 'show vlan brief'."""
+        try:
+            self.vlan_list.setUpdatesEnabled(False)
             try:
-                output = self.connection.send_command("show vlan brief")
                 self.vlan_list.clear()
-                lines = output.split('\n')
-                for line in lines:
-                    if line.strip() and line[0].isdigit():
-                        columns = line.split()
+                for line in output.splitlines():
+                    # VLAN rows start with the ID; port continuation lines start with spaces
+                    if line[:1].isdigit():
+                        columns = line.split(None, 2)
                         if len(columns) >= 2:
                             vlan_id = columns[0]
                             vlan_name = columns[1]
-                            self.vlan_list.addItem(f"VLAN {vlan_id}: {vlan_name}")
-            except Exception as e:
-                self.output_area.append(f'Hata VLAN yüklenirken: {str(e)}')
-        else:
-            self.vlan_list.clear()
+                            item = QListWidgetItem(f"VLAN {vlan_id}: {vlan_name}", self.vlan_list)
+                            item.setData(VLAN_ID_ROLE, vlan_id)
+            finally:
+                self.vlan_list.setUpdatesEnabled(True)
+        except Exception as e:
+            self.on_load_vlans_error(str(e))
+
+    def on_load_vlans_error(self, error_message):
+        """Reports a failure to load the VLAN list."""
+        self.output_area.append(f'Hata VLAN yüklenirken: {error_message}')
 
     def open_interface_config(self, item):
         """Opens the interface configuration dialog for the double-clicked interface."""
@@ -1851,26 +3118,57 @@ class SwitchTabWidget(QWidget):
             config_dialog.exec_()
 
     def show_interface_details(self, item):
-        """Displays detailed configuration for the clicked interface."""
+        """Schedules display of the detailed configuration for the clicked interface."""
         custom_widget = self.interface_list.itemWidget(item)
         if custom_widget and self.connection:
-            interface_name = custom_widget.get_interface_name()
-            try:
-                output = self.connection.send_command(f"show running-config interface {interface_name}")
-                self.interface_info.setPlainText(output)
-            except Exception as e:
-                self.interface_info.setPlainText(f'Hata: {str(e)}')
+            self.pending_detail_interface = custom_widget.get_interface_name()
+            self.detail_timer.start()
+
+    def fetch_interface_details(self):
+        """Fetches and displays the configuration of the most recently clicked interface."""
+        interface_name = self.pending_detail_interface
+        self.pending_detail_interface = None
+        if interface_name and self.connection:
+            cached = self._cached_interface_config(interface_name)
+            if cached is not None:
+                self.interface_info.setPlainText(cached)
+                return
+
+            # Results arrive in request order, so the last click always wins
+            generation = config_generation(self.connection)
+            self.run_command(f"show running-config interface {interface_name}",
+                             lambda output: self.on_interface_details_fetched(interface_name, generation, output),
+                             self.show_info_error)
+
+    def on_interface_details_fetched(self, interface_name, generation, output):
+        """Shows a fetched interface configuration and remembers it for later clicks."""
+        self._remember_interface_config(interface_name, generation, output)
+        self.interface_info.setPlainText(output)
+
+    def _cached_interface_config(self, interface_name):
+        """Returns the cached configuration of an interface, or None if it is missing or stale."""
+        cached = self._iface_cfg_cache.get(interface_name)
+        if cached and cached[0] == config_generation(self.connection):
+            self._iface_cfg_cache.move_to_end(interface_name)
+            return cached[1]
+        return None
+
+    def _remember_interface_config(self, interface_name, generation, output):
+        """Stores an interface configuration fetched at the given config generation."""
+        self._iface_cfg_cache[interface_name] = (generation, output)
+        self._iface_cfg_cache.move_to_end(interface_name)
+        if len(self._iface_cfg_cache) > INTERFACE_CONFIG_CACHE_SIZE:
+            self._iface_cfg_cache.popitem(last=False)
+
+    def show_info_error(self, error_message):
+        """Shows a failed interface/VLAN query in the information area."""
+        self.interface_info.setPlainText(f'Hata: {error_message}')
 
     def show_vlan_ports(self, item):
         """Displays ports associated with the selected VLAN."""
         if self.connection:
-            vlan_text = item.text()
-            vlan_id = vlan_text.split(':')[0].replace('VLAN ', '')
-            try:
-                output = self.connection.send_command(f"show vlan id {vlan_id}")
-                self.interface_info.setPlainText(output)
-            except Exception as e:
-                self.interface_info.setPlainText(f'Hata: {str(e)}')
+            vlan_id = item.data(VLAN_ID_ROLE)
+            self.run_command(f"show vlan id {vlan_id}", self.interface_info.setPlainText, self.show_info_error)
 
     def execute_command(self):
         """Executes a single command entered by the user."""
@@ -1887,15 +3185,21 @@ class SwitchTabWidget(QWidget):
                 self.command_input.clear()
                 return
 
-            try:
-                output = self.connection.send_command(command)
-                self.output_area.append(f'\n> {command}\n{output}')
-            except Exception as e:
-                self.output_area.append(f'Hata: {str(e)}')
+            # Keep the input disabled until the command has returned
             self.command_input.clear()
+            self.command_input.setEnabled(False)
+            worker = self.run_command(command,
+                                      lambda output: self.output_area.append(f'\n> {command}\n{output}'),
+                                      lambda error_message: self.output_area.append(f'Hata: {error_message}'))
+            worker.signals.finished.connect(self.on_execute_command_finished)
         else:
             self.output_area.append("Önce switch'e bağlanın!")
 
+    def on_execute_command_finished(self):
+        """Re-enables the command input after a command has returned."""
+        self.command_input.setEnabled(self.connection is not None)
+        self.command_input.setFocus()
+
     def on_search_interface_changed(self, state):
         """Handle Search Interface checkbox state change."""
         if state == Qt.Checked:
@@ -1929,7 +3233,12 @@ class SwitchTabWidget(QWidget):
                 self.exc_checkbox.setChecked(False)
             return
 
-        search_dialog = SearchDialog(self, self.connection, search_mode)
+        # Reuse the running configuration this session already fetched, if any
+        cached = peek_running_config(self.connection)
+        if cached:
+            search_dialog = SearchDialog(self, self.connection, search_mode, cached_config=cached[0], cached_at=cached[1])
+        else:
+            search_dialog = SearchDialog(self, self.connection, search_mode)
         search_dialog.interfaces_selected.connect(self.on_search_interfaces_selected)
         
         result = search_dialog.exec_()
@@ -1949,6 +3258,11 @@ class SwitchTabWidget(QWidget):
         self.exc_checkbox.setChecked(False)
 
 
+# Item data roles of the saved switch list
+SWITCH_IP_ROLE = Qt.UserRole
+SWITCH_NAME_ROLE = Qt.UserRole + 1
+
+
 # New SortableSwitchListWidget Class
 class SortableSwitchListWidget(QListWidget):
     """
@@ -1969,12 +3283,7 @@ class SortableSwitchListWidget(QListWidget):
         if event.source() == self and event.dropAction() == Qt.MoveAction:
             super().dropEvent(event)
             # After the internal move, get the new order of IPs
-            new_order_ips = []
-            for i in range(self.count()):
-                item_text = self.item(i).text()
-                # Extract IP from the item text (e.g., "192.168.1.1 (SwitchName)" -> "192.168.1.1")
-                ip = item_text.split(' ')[0]
-                new_order_ips.append(ip)
+            new_order_ips = [self.item(i).data(SWITCH_IP_ROLE) for i in range(self.count())]
             
             self.order_changed.emit(new_order_ips) # Emit the signal with the new order
             event.accept()
@@ -1988,10 +3297,33 @@ class CiscoSwitchGUI(QWidget):
     """
     def __init__(self):
         super().__init__()
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.instance()
         self.initUI()
         self.load_saved_switches()
 
+        # Warm up the credential cache in the background
+        self.credential_prefetch_task = CredentialPrefetchRunnable(self.config_manager,
+                                                                   self.config_manager.get_saved_switches())
+        self.credential_prefetch_task.signals.completed.connect(self.config_manager.cache_credentials)
+        QThreadPool.globalInstance().start(self.credential_prefetch_task)
+
+        # Periodically close pooled connections that have gone idle
+        self.pool_sweep_timer = QTimer(self)
+        self.pool_sweep_timer.timeout.connect(self.sweep_connection_pool)
+        self.pool_sweep_timer.start(CONNECTION_POOL_SWEEP_INTERVAL * 1000)
+
+        # Several quick reorders of the switch list are saved with a single write
+        self.pending_switch_order = None
+        self.save_order_timer = QTimer(self)
+        self.save_order_timer.setSingleShot(True)
+        self.save_order_timer.setInterval(SWITCH_ORDER_SAVE_DELAY_MS)
+        self.save_order_timer.timeout.connect(self.flush_switch_order)
+
+        # Read the template tree into memory in the background
+        # The shared instance is created here, on the GUI thread
+        self.template_preload_task = TemplatePreloadRunnable(TemplateManager.instance())
+        QThreadPool.globalInstance().start(self.template_preload_task)
+
     def initUI(self):
         self.setWindowTitle('Cisco Switch Management Interface')
         self.setGeometry(100, 100, 1200, 800)
@@ -2030,6 +3362,11 @@ class CiscoSwitchGUI(QWidget):
         self.save_button = QPushButton('Kaydet')
         self.save_button.clicked.connect(self.save_switch)
         add_switch_group.addWidget(self.save_button)
+
+        # Save is only enabled once IP, username and password are all filled in
+        for line_edit in (self.ip_input, self.user_input, self.pass_input):
+            line_edit.textChanged.connect(self.update_save_button)
+        self.update_save_button()
         
         left_layout.addLayout(add_switch_group)
 
@@ -2043,17 +3380,32 @@ class CiscoSwitchGUI(QWidget):
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
+        # Open switch tabs by IP, kept in step with the tab widget by open_switch_tab/close_tab
+        self.tabs_by_ip = {}
         main_layout.addWidget(self.tab_widget, 3)
 
         self.setLayout(main_layout)
 
+    def sweep_connection_pool(self):
+        """Closes idle pooled connections on the shared thread pool."""
+        self.pool_sweep_task = PoolSweepRunnable()
+        QThreadPool.globalInstance().start(self.pool_sweep_task)
+
     def save_switch_order_after_drag(self, new_ordered_ips):
         """
         Receives the new order of switch IPs after a drag-and-drop operation
-        and saves this new order to the configuration file.
+        and schedules saving it to the configuration file.
         """
-        print(f"DEBUG: New switch order received: {new_ordered_ips}")
-        self.config_manager.save_switches_order(new_ordered_ips)
+        logger.debug("New switch order received: %s", new_ordered_ips)
+        self.pending_switch_order = new_ordered_ips
+        self.save_order_timer.start()
+
+    def flush_switch_order(self):
+        """Writes the most recent switch order, if one is waiting to be saved."""
+        self.save_order_timer.stop()
+        if self.pending_switch_order is not None:
+            self.config_manager.save_switches_order(self.pending_switch_order)
+            self.pending_switch_order = None
 
     def open_template_manager_dialog(self):
         """Opens the dialog for managing configuration templates."""
@@ -2066,31 +3418,28 @@ class CiscoSwitchGUI(QWidget):
         if selected_item:
             context_menu = QMenu(self)
             
-            edit_action = QAction("Düzenle", self)
+            edit_action = QAction("Düzenle", context_menu)
             edit_action.triggered.connect(self.edit_selected_switch)
             context_menu.addAction(edit_action)
             
-            delete_action = QAction("Sil", self)
+            delete_action = QAction("Sil", context_menu)
             delete_action.triggered.connect(self.delete_selected_switch)
             context_menu.addAction(delete_action)
             
             context_menu.exec_(self.switch_list.viewport().mapToGlobal(position))
+            context_menu.deleteLater()
 
     def edit_selected_switch(self):
         """Allows editing of selected switch's IP, username, password, and name."""
+        self.flush_switch_order()
         current_item = self.switch_list.currentItem()
         if current_item:
-            current_text = current_item.text()
-            current_ip = current_text.split(' ')[0]
+            current_ip = current_item.data(SWITCH_IP_ROLE)
+            current_name = current_item.data(SWITCH_NAME_ROLE)
             
             # Get current credentials
             username, password = self.config_manager.get_switch_credentials(current_ip)
             
-            # Get current name from the display text
-            current_name = ""
-            if ' (' in current_text and ')' in current_text:
-                current_name = current_text.split(' (')[1].rstrip(')')
-            
             # Create edit dialog
             dialog = QDialog(self)
             dialog.setWindowTitle("Switch Düzenle")
@@ -2135,14 +3484,24 @@ class CiscoSwitchGUI(QWidget):
                 new_password = pass_edit.text().strip()
                 
                 if new_ip and new_username and new_password:
-                    # If IP changed, delete old entry
-                    if new_ip != current_ip:
-                        self.config_manager.delete_switch(current_ip)
-                    
-                    # Save new/updated entry
-                    if self.config_manager.save_switch_credentials(new_ip, new_username, new_password, new_name):
+                    # Delete and save below are written to disk together
+                    try:
+                        with self.config_manager.batch():
+                            # If IP changed, delete old entry
+                            if new_ip != current_ip:
+                                self.config_manager.delete_switch(current_ip)
+                            
+                            # Save new/updated entry
+                            saved = self.config_manager.save_switch_credentials(new_ip, new_username, new_password, new_name)
+                    except Exception:
+                        # switches.json could not be written; batch() has already logged why
+                        saved = False
+                    if saved:
                         QMessageBox.information(self, "Başarılı", "Switch bilgileri güncellendi!")
-                        self.load_saved_switches()
+                        # A changed IP was removed and saved again at the end of the list
+                        if new_ip != current_ip:
+                            self.remove_switch_item(current_ip)
+                        self.update_switch_item(new_ip, new_name)
                     else:
                         QMessageBox.critical(self, "Hata", "Switch bilgileri güncellenirken hata oluştu!")
                 else:
@@ -2150,45 +3509,77 @@ class CiscoSwitchGUI(QWidget):
 
     def delete_selected_switch(self):
         """Deletes the selected switch from the list and keyring."""
+        self.flush_switch_order()
         current_item = self.switch_list.currentItem()
         if current_item:
-            ip = current_item.text().split(' ')[0]
+            ip = current_item.data(SWITCH_IP_ROLE)
             reply = QMessageBox.question(self, 'Silme Onayı', f'{ip} adresli switch\'i silmek istediğinizden emin misiniz?',
                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
                 if self.config_manager.delete_switch(ip):
                     QMessageBox.information(self, "Başarılı", "Switch silindi!")
-                    self.load_saved_switches()
+                    self.remove_switch_item(ip)
                 else:
                     QMessageBox.critical(self, "Hata", "Switch silinirken hata oluştu!")
 
     def load_saved_switches(self):
         """Loads saved switches (including IP and Name) into the list widget."""
-        self.switch_list.clear()
-        switches_data = self.config_manager.get_saved_switches_full()
-        for switch_info in switches_data:
-            ip = switch_info["ip"]
-            name = switch_info.get("name", "")
-            
-            # Display format: "IP (Name)" or just "IP" if no name
-            display_text = f"{ip} ({name})" if name else ip
-            self.switch_list.addItem(display_text)
+        switches = self.config_manager.get_saved_switch_names()
+        # Rebuild the list without per-item signals or repaints
+        self.switch_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.switch_list):
+                self.switch_list.clear()
+                for ip, name in switches:
+                    self._set_switch_item(QListWidgetItem(self.switch_list), ip, name)
+        finally:
+            self.switch_list.setUpdatesEnabled(True)
+
+    def _set_switch_item(self, item, ip, name):
+        """Sets the display text and data of a saved switch list item."""
+        # Display format: "IP (Name)" or just "IP" if no name
+        item.setText(f"{ip} ({name})" if name else ip)
+        item.setData(SWITCH_IP_ROLE, ip)
+        item.setData(SWITCH_NAME_ROLE, name)
+
+    def _find_switch_row(self, ip):
+        """Returns the row of the switch with the given IP in the saved switch list, or -1."""
+        model = self.switch_list.model()
+        matches = model.match(model.index(0, 0), SWITCH_IP_ROLE, ip, 1, Qt.MatchExactly)
+        return matches[0].row() if matches else -1
+
+    def update_switch_item(self, ip, name):
+        """Updates the list entry of a saved switch in place, or appends it if it is new."""
+        row = self._find_switch_row(ip)
+        item = self.switch_list.item(row) if row != -1 else QListWidgetItem(self.switch_list)
+        self._set_switch_item(item, ip, name)
+
+    def remove_switch_item(self, ip):
+        """Removes the list entry of a deleted switch."""
+        row = self._find_switch_row(ip)
+        if row != -1:
+            self.switch_list.takeItem(row)
 
     def save_switch(self):
         """Saves a new switch's IP, username, and password."""
-        ip = self.ip_input.text().strip()
-        username = self.user_input.text().strip()
-        password = self.pass_input.text().strip()
+        self.flush_switch_order()
+        ip, username, password = self.read_switch_inputs()
         
         if ip and username and password:
             # Prompt for optional switch name
             name, ok = QInputDialog.getText(self, "Switch Adı", "Switch için bir isim girin (isteğe bağlı):")
-            if not ok:
-                name = ""  # User cancelled, use empty name
+            name = name.strip() if ok else ""
             
-            if self.config_manager.save_switch_credentials(ip, username, password, name.strip()):
+            # A cancelled or empty name (None) keeps the current name of an already saved switch
+            existing_name = ""
+            if not name:
+                row = self._find_switch_row(ip)
+                if row != -1:
+                    existing_name = self.switch_list.item(row).data(SWITCH_NAME_ROLE) or ""
+            
+            if self.config_manager.save_switch_credentials(ip, username, password, name or None):
                 QMessageBox.information(self, "Başarılı", "Switch kaydedildi!")
-                self.load_saved_switches()
+                self.update_switch_item(ip, name or existing_name)
                 self.ip_input.clear()
                 self.user_input.clear()
                 self.pass_input.clear()
@@ -2197,9 +3588,17 @@ class CiscoSwitchGUI(QWidget):
         else:
             QMessageBox.warning(self, "Uyarı", "IP, kullanıcı adı ve şifre alanlarını doldurun!")
 
+    def read_switch_inputs(self):
+        """Returns the stripped (ip, username, password) from the add-switch inputs."""
+        return self.ip_input.text().strip(), self.user_input.text().strip(), self.pass_input.text().strip()
+
+    def update_save_button(self):
+        """Enables the Save button only when all add-switch inputs are filled in."""
+        self.save_button.setEnabled(all(self.read_switch_inputs()))
+
     def load_selected_switch_to_inputs(self, item):
         """Fills IP, username, and password inputs only. Does not open a tab."""
-        ip = item.text().split(' ')[0]
+        ip = item.data(SWITCH_IP_ROLE)
         username, password = self.config_manager.get_switch_credentials(ip)
         
         if username and password:
@@ -2209,20 +3608,20 @@ class CiscoSwitchGUI(QWidget):
 
     def open_switch_tab(self, item):
         """Opens a new tab for the selected saved switch when double-clicked."""
-        ip = item.text().split(' ')[0]
+        ip = item.data(SWITCH_IP_ROLE)
         username, password = self.config_manager.get_switch_credentials(ip)
         
         if username and password:
             # Check if tab already exists
-            for i in range(self.tab_widget.count()):
-                tab_widget = self.tab_widget.widget(i)
-                if hasattr(tab_widget, 'ip') and tab_widget.ip == ip:
-                    self.tab_widget.setCurrentIndex(i)
-                    QMessageBox.information(self, "Bilgi", f"{ip} için tab zaten açık!")
-                    return
+            existing_tab = self.tabs_by_ip.get(ip)
+            if existing_tab is not None:
+                self.tab_widget.setCurrentWidget(existing_tab)
+                QMessageBox.information(self, "Bilgi", f"{ip} için tab zaten açık!")
+                return
 
             # Create new tab
             tab = SwitchTabWidget(ip, username, password)
+            self.tabs_by_ip[ip] = tab
             tab_name = f"{ip}"
             self.tab_widget.addTab(tab, tab_name)
             self.tab_widget.setCurrentWidget(tab)
@@ -2232,27 +3631,19 @@ class CiscoSwitchGUI(QWidget):
     def close_tab(self, index):
         """Triggered when a tab close request is received."""
         tab_widget = self.tab_widget.widget(index)
-        if hasattr(tab_widget, 'disconnect_from_switch'):
+        if isinstance(tab_widget, SwitchTabWidget):
             tab_widget.disconnect_from_switch()
+            self.tabs_by_ip.pop(tab_widget.ip, None)
         self.tab_widget.removeTab(index)
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = QApplication([])
-    
-    # Create icon files if they don't exist
-    icon_files = ['green_icon.png', 'red_icon.png', 'black_icon.png']
-    for icon_file in icon_files:
-        if not os.path.exists(icon_file):
-            pixmap = QPixmap(16, 16)
-            if 'green' in icon_file:
-                pixmap.fill(Qt.green)
-            elif 'red' in icon_file:
-                pixmap.fill(Qt.red)
-            elif 'black' in icon_file:
-                pixmap.fill(Qt.black)
-            pixmap.save(icon_file)
+    QThreadPool.globalInstance().setMaxThreadCount(WORKER_THREAD_LIMIT)
     
     window = CiscoSwitchGUI()
     window.show()
-    app.exec_()
\ No newline at end of file
+    app.exec_()
+    window.flush_switch_order()
+    ConnectionPool.instance().close_all()
\ No newline at end of file